@@ -44,6 +44,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -0,0 +1,99 @@
+"""
+Persistent CLI command host used by the CLI interface tests
+
+Imports the framework CLI once and executes commands received as JSON frames
+on stdin, so a test session that issues many commands only pays interpreter
+start-up once. Enabled with CLI_TEST_BACKEND=host, see
+tests/integration/test_cli_interface.py.
+"""
+
+import io
+import json
+import os
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+# Make the framework package importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cli import cli
+
+
+def run_frame(frame):
+    """Run one command frame in-process and return (exit_code, stdout, stderr)
+
+    A frame looks like {"cmd": "audit", "path": "...", "flags": [...]}, with
+    optional "cwd" and "env" entries applied for the duration of the command.
+    """
+    args = [frame["cmd"], frame["path"], *frame.get("flags", [])]
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    original_cwd = os.getcwd()
+    original_env = os.environ.copy()
+
+    try:
+        if frame.get("cwd"):
+            os.chdir(frame["cwd"])
+        os.environ.update(frame.get("env") or {})
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                cli.main(args=args, prog_name="src", standalone_mode=True)
+                exit_code = 0
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(original_cwd)
+        os.environ.clear()
+        os.environ.update(original_env)
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def main():
+    """Serve command frames from stdin until it is closed
+
+    Each reply is a JSON object {"rc", "stdout", "stderr"} preceded by its byte
+    length on its own line. A single "ready" line is sent first, once the CLI
+    is imported. The reply channel is a private copy of the original stdout;
+    file descriptor 1 is pointed at stderr so that output written directly to
+    it (for example by child processes) cannot corrupt a frame.
+    """
+    wire = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    wire.write(b"ready\n")
+    wire.flush()
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+
+        exit_code, stdout, stderr = run_frame(json.loads(line))
+        payload = json.dumps({
+            "rc": exit_code,
+            "stdout": stdout,
+            "stderr": stderr
+        }).encode("utf-8")
+
+        wire.write(b"%d\n" % len(payload))
+        wire.write(payload)
+        wire.flush()
+
+
+if __name__ == "__main__":
+    main()
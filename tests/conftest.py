@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures for framework validation tests
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Iterator, Tuple
+
+import pytest
+
+# Add the tests directory to the path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fixtures.project_templates import build_project_template, copy_project_template, tmp_root
+
+
+@pytest.fixture(scope="session")
+def project_base_dir() -> Iterator[Path]:
+    """Session directory that fixture projects are created in
+
+    Lives under tmp_root(), so by default building, copying and removing
+    projects happens on tmpfs and never touches disk.
+    """
+    base_dir = Path(tempfile.mkdtemp(prefix="cli_tests_", dir=tmp_root()))
+    try:
+        yield base_dir
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def empty_project_template() -> Tuple[Path, Path]:
+    """Empty project (no tests), built once and cached"""
+    return build_project_template("empty")
+
+
+@pytest.fixture(scope="session")
+def partial_project_template() -> Tuple[Path, Path]:
+    """Project with some existing tests, built once and cached"""
+    return build_project_template("partial")
+
+
+@pytest.fixture(scope="session")
+def broken_project_template() -> Tuple[Path, Path]:
+    """Project with broken code/tests, built once and cached"""
+    return build_project_template("broken")
+
+
+@pytest.fixture
+def empty_project(project_base_dir, empty_project_template) -> Iterator[Path]:
+    """Fresh copy of the empty project for a single test"""
+    with copy_project_template(empty_project_template, project_base_dir) as project_path:
+        yield project_path
+
+
+@pytest.fixture
+def partial_project(project_base_dir, partial_project_template) -> Iterator[Path]:
+    """Fresh copy of the partial project for a single test"""
+    with copy_project_template(partial_project_template, project_base_dir) as project_path:
+        yield project_path
+
+
+@pytest.fixture
+def broken_project(project_base_dir, broken_project_template) -> Iterator[Path]:
+    """Fresh copy of the broken project for a single test"""
+    with copy_project_template(broken_project_template, project_base_dir) as project_path:
+        yield project_path
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Mock LLM configuration and provider, created once per session"""
+    # Imported here so suites that never use the mock provider do not pay for
+    # importing langchain
+    from mock_llm_provider import MockLLMConfig
+    
+    config = MockLLMConfig()
+    config.setup_mock_provider()
+    return config
+
+
+@pytest.fixture
+def mock_provider(mock_config):
+    """The session's mock provider, with its call history cleared for this test"""
+    provider = mock_config.mock_provider
+    provider.reset_call_history()
+    return provider
@@ -0,0 +1,133 @@
+"""
+Cached fixture project templates shared by the conftest fixtures and test runners
+
+Templates are built once from FixtureManager and cached on tmpfs when it is
+available; each test works on its own copy.
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Iterator, Tuple
+
+# Memory-backed filesystem used for fixture projects when available
+TMPFS_ROOT = Path("/dev/shm")
+
+
+def tmp_root() -> Path:
+    """Return the directory fixture projects are created under
+
+    TEST_FIXTURE_TMPDIR takes precedence when set; otherwise tmpfs is used
+    when it is available and writable, else the system temp dir.
+    """
+    override = os.environ.get("TEST_FIXTURE_TMPDIR")
+    if override:
+        return Path(override)
+    if TMPFS_ROOT.is_dir() and os.access(TMPFS_ROOT, os.W_OK):
+        return TMPFS_ROOT
+    return Path(tempfile.gettempdir())
+
+
+@functools.lru_cache(maxsize=None)
+def _template_cache_key() -> str:
+    """Hash of the fixture manager's source, computed once per process"""
+    # Imported here so suites that never build a template do not depend on
+    # the fixture manager
+    from . import fixture_manager as fixture_module
+    
+    return hashlib.blake2b(Path(fixture_module.__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def _prune_template_cache(cache_root: Path, key: str) -> None:
+    """Remove templates cached under any key other than key
+
+    cache_root only holds templates for the running interpreter, so sessions
+    on other interpreters never lose their templates. In-progress builds
+    (dot-prefixed) are left to their owners.
+    """
+    for entry in cache_root.iterdir():
+        if entry.name.startswith(".") or entry.name.endswith(f"_{key}"):
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+
+def build_project_template(project_type: str) -> Tuple[Path, Path]:
+    """Build one fixture project variant, reusing a cached build when possible
+
+    Templates are cached under fx_cache/<interpreter cache tag>/ keyed on
+    _template_cache_key(), so one build is shared by every session and
+    pytest-xdist worker on the same interpreter until the fixture code
+    changes; that interpreter's templates for other keys are pruned when a
+    new one is built. A template is built in a private directory,
+    together with the marker recording where the project sits, and renamed
+    into place, so concurrent builders never observe a partial tree and a
+    builder that loses the race discards its whole build.
+
+    Returns:
+        Tuple of (template_root, project_path), where project_path is the
+        project FixtureManager created somewhere under template_root
+    """
+    key = _template_cache_key()
+    
+    cache_root = tmp_root() / "fx_cache" / sys.implementation.cache_tag
+    cache_root.mkdir(parents=True, exist_ok=True)
+    template_root = cache_root / f"{project_type}_{key}"
+    # Records where the project sits inside template_root
+    marker_name = ".project"
+    
+    if not template_root.is_dir():
+        from . import fixture_manager as fixture_module
+        
+        build_root = Path(tempfile.mkdtemp(prefix=f".{project_type}_", dir=cache_root))
+        try:
+            create_project = getattr(fixture_module.FixtureManager(), f"create_{project_type}_project")
+            project_path = Path(create_project(build_root))
+            (build_root / marker_name).write_text(str(project_path.relative_to(build_root)))
+            os.rename(build_root, template_root)
+        except Exception:
+            shutil.rmtree(build_root, ignore_errors=True)
+            # A failed rename means another session or worker published the
+            # same template first; anything else is a real build failure
+            if not template_root.is_dir():
+                raise
+        else:
+            _prune_template_cache(cache_root, key)
+    
+    return template_root, template_root / (template_root / marker_name).read_text()
+
+
+@contextlib.contextmanager
+def copy_project_template(template: Tuple[Path, Path], base_dir: Path) -> Iterator[Path]:
+    """Copy a built template into a fresh directory and yield the copied project path
+
+    The copy uses `cp --reflink=auto` so copy-on-write filesystems share file
+    data with the template, falling back to copytree. Files are never
+    hard-linked: the CLI rewrites test files in place, which would otherwise
+    modify the shared template. The copy is removed when the context exits.
+    """
+    template_root, project_path = template
+    destination = Path(tempfile.mkdtemp(prefix="proj_", dir=base_dir)) / "proj"
+    
+    try:
+        subprocess.run(
+            ["cp", "--reflink=auto", "-R", str(template_root), str(destination)],
+            check=True,
+            capture_output=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(destination, ignore_errors=True)
+        shutil.copytree(template_root, destination)
+    
+    try:
+        yield destination / project_path.relative_to(template_root)
+    finally:
+        shutil.rmtree(destination.parent, ignore_errors=True)
@@ -10,12 +10,16 @@ Requirements tested:
 - 2.5: Error handling for invalid configurations
 """
 
+import os
+import socket
+import contextlib
 import pytest
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 # Import framework components
 import sys
@@ -31,8 +35,60 @@ from src.agents import (
 
 # Import test infrastructure
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from mock_llm_provider import MockLLMProvider, MockLLMConfig, configure_mock_environment, restore_environment
+from mock_llm_provider import (
+    MockLLMProvider, MockLLMConfig, configure_mock_environment, restore_environment,
+    patch_framework_with_mock
+)
 from fixtures.fixture_manager import FixtureManager
+from fixtures.project_templates import build_project_template, copy_project_template, tmp_root
+
+# Environment variables that LLMConfig inspects for provider detection
+_PROVIDER_ENV_KEYS = (
+    "OPENAI_API_KEY", "AZURE_API_KEY", "ANTHROPIC_API_KEY",
+    "GOOGLE_API_KEY", "COHERE_API_KEY"
+)
+
+# Skip messages shared by several stage results; identifier-like keys such as
+# "success" and "error" are already interned by the compiler
+_MSG_NO_UNITS = sys.intern("No code units available")
+_MSG_NO_UNITS_OR_TESTS = sys.intern("No code units or test cases")
+
+# (prompt_type, prompt) pairs exercised by test_mock_provider_integration
+_RESPONSE_TYPE_PROMPTS = (
+    ("test_generation", "Generate comprehensive test cases for function calculate()"),
+    ("test_judgment", "Evaluate the following test case for quality"),
+    ("audit_report", "Generate audit report for testing improvements"),
+    ("code_analysis", "Analyze the structure of this Python code")
+)
+
+
+@contextlib.contextmanager
+def _default_socket_timeout(timeout: float):
+    """Temporarily set the default timeout for newly created sockets"""
+    original_timeout = socket.getdefaulttimeout()
+    socket.setdefaulttimeout(timeout)
+    try:
+        yield
+    finally:
+        socket.setdefaulttimeout(original_timeout)
+
+
+class _StageSkipped(Exception):
+    """Raised by a workflow stage whose inputs from earlier stages are missing"""
+
+
+def _run_stage(run_stage: Callable[[], Dict[str, Any]],
+               failure_fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one stage callable and record its fields, or failure_fields and the error"""
+    try:
+        return {"success": True, **run_stage(), "error": None}
+    except Exception as e:
+        return {"success": False, **failure_fields, "error": str(e)}
+
+
+def _framework_ready(framework: TestingFramework) -> bool:
+    """Check that a framework has both its LLM config and LLM instance"""
+    return framework.llm is not None and framework.llm_config is not None
 
 
 class APITestRunner:
@@ -44,10 +100,32 @@ class APITestRunner:
     handling for invalid configurations.
     """
     
+    # Test methods executed by run_all_tests, in reporting order
+    TEST_METHOD_NAMES = (
+        "test_framework_initialization_default",
+        "test_framework_initialization_with_provider",
+        "test_framework_initialization_invalid_path",
+        "test_agent_creation_and_configuration",
+        "test_llm_provider_detection",
+        "test_error_handling_invalid_configurations",
+        "test_framework_state_initialization",
+        # Workflow tests
+        "test_run_full_audit_method",
+        "test_individual_agent_methods",
+        "test_audit_report_generation",
+        "test_framework_workflow_integration",
+        # LLM provider integration tests
+        "test_automatic_provider_detection",
+        "test_fallback_behavior_missing_credentials",
+        "test_mock_provider_integration",
+        "test_provider_configuration_validation"
+    )
+    
     def __init__(self):
         self.fixture_manager = FixtureManager()
         self.mock_config = MockLLMConfig()
         self.temp_dirs = []
+        self.project_copies = contextlib.ExitStack()
         self.original_env = None
         
     def setup_test_environment(self):
@@ -59,35 +137,27 @@ class APITestRunner:
         if self.original_env:
             restore_environment(self.original_env)
         
-        # Clean up temporary directories
+        # Clean up project copies and temporary directories
+        self.project_copies.close()
         for temp_dir in self.temp_dirs:
             if temp_dir.exists():
                 shutil.rmtree(temp_dir, ignore_errors=True)
         self.temp_dirs.clear()
     
     def create_temp_project(self, project_type: str = "empty") -> Path:
-        """Create a temporary test project"""
-        temp_dir = Path(tempfile.mkdtemp())
+        """Create a temporary test project by copying the shared cached template"""
+        temp_dir = Path(tempfile.mkdtemp(dir=tmp_root()))
         self.temp_dirs.append(temp_dir)
         
-        if project_type == "empty":
-            project_path = self.fixture_manager.create_empty_project(temp_dir)
-        elif project_type == "partial":
-            project_path = self.fixture_manager.create_partial_project(temp_dir)
-        elif project_type == "broken":
-            project_path = self.fixture_manager.create_broken_project(temp_dir)
-        else:
-            project_path = self.fixture_manager.create_empty_project(temp_dir)
-        return project_path
+        return self.project_copies.enter_context(
+            copy_project_template(build_project_template(project_type), temp_dir)
+        )
     
     def test_framework_initialization_default(self) -> Dict[str, Any]:
         """Test TestingFramework initialization with default parameters"""
-        results = {
-            "test_name": "framework_initialization_default",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             # Create test project
@@ -107,8 +177,7 @@ class APITestRunner:
             assert framework.test_path.exists()
             
             # Validate LLM config
-            assert framework.llm_config is not None
-            assert framework.llm is not None
+            assert _framework_ready(framework), "framework LLM not initialized"
             
             # Validate agents were created
             assert framework.code_mapper is not None
@@ -124,8 +193,8 @@ class APITestRunner:
             assert isinstance(framework.generated_tests, list)
             assert isinstance(framework.modified_tests, list)
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "project_path": str(project_path),
                 "directories_created": [
                     str(framework.reports_path),
@@ -136,18 +205,20 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Framework initialization failed: {str(e)}")
+            errors.append(f"Framework initialization failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "framework_initialization_default",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_framework_initialization_with_provider(self) -> Dict[str, Any]:
         """Test TestingFramework initialization with specific provider"""
-        results = {
-            "test_name": "framework_initialization_with_provider",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("empty")
@@ -177,8 +248,8 @@ class APITestRunner:
                 assert agent is not None
                 assert hasattr(agent, 'llm')
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "provider_requested": Provider.OPENAI.value,
                 "model_requested": "gpt-4",
                 "temperature": 0.2,
@@ -186,18 +257,20 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Provider-specific initialization failed: {str(e)}")
+            errors.append(f"Provider-specific initialization failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "framework_initialization_with_provider",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_framework_initialization_invalid_path(self) -> Dict[str, Any]:
         """Test TestingFramework initialization with invalid project path"""
-        results = {
-            "test_name": "framework_initialization_invalid_path",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             # Test with non-existent path
@@ -211,8 +284,8 @@ class APITestRunner:
             assert framework.reports_path.exists()  # Should be created
             assert framework.test_path.exists()     # Should be created
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "invalid_path": str(invalid_path),
                 "directories_created": True,
                 "framework_initialized": True
@@ -220,22 +293,24 @@ class APITestRunner:
             
         except Exception as e:
             # If it raises an exception, that's also valid behavior
-            results["passed"] = True  # This is expected behavior
-            results["errors"].append(f"Expected error for invalid path: {str(e)}")
-            results["details"] = {
+            passed = True  # This is expected behavior
+            errors.append(f"Expected error for invalid path: {str(e)}")
+            details = {
                 "error_handling": "Framework properly handles invalid paths"
             }
         
-        return results
+        return {
+            "test_name": "framework_initialization_invalid_path",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_agent_creation_and_configuration(self) -> Dict[str, Any]:
         """Test that all agents are properly created and configured"""
-        results = {
-            "test_name": "agent_creation_and_configuration",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
@@ -275,26 +350,28 @@ class APITestRunner:
                     "llm_type": type(agent_instance.llm).__name__
                 }
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "agents_tested": len(agent_tests),
                 "all_agents_valid": True,
                 "agent_details": agent_details
             }
             
         except Exception as e:
-            results["errors"].append(f"Agent creation/configuration failed: {str(e)}")
+            errors.append(f"Agent creation/configuration failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "agent_creation_and_configuration",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_llm_provider_detection(self) -> Dict[str, Any]:
         """Test automatic LLM provider detection"""
-        results = {
-            "test_name": "llm_provider_detection",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("empty")
@@ -310,8 +387,8 @@ class APITestRunner:
             # Create framework and test provider detection
             framework = TestingFramework(project_path=project_path)
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "available_providers": {k.value: v for k, v in available_providers.items()},
                 "default_provider": default_provider.value,
                 "provider_info": provider_info,
@@ -319,18 +396,20 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Provider detection failed: {str(e)}")
+            errors.append(f"Provider detection failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "llm_provider_detection",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_error_handling_invalid_configurations(self) -> Dict[str, Any]:
         """Test error handling for various invalid configurations"""
-        results = {
-            "test_name": "error_handling_invalid_configurations",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         error_scenarios = []
         
@@ -395,25 +474,27 @@ class APITestRunner:
                     "error": f"Unexpected error type: {str(e)}"
                 })
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "error_scenarios_tested": len(error_scenarios),
                 "scenarios": error_scenarios
             }
             
         except Exception as e:
-            results["errors"].append(f"Error handling test failed: {str(e)}")
+            errors.append(f"Error handling test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "error_handling_invalid_configurations",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_framework_state_initialization(self) -> Dict[str, Any]:
         """Test that framework state is properly initialized"""
-        results = {
-            "test_name": "framework_state_initialization",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
@@ -438,8 +519,8 @@ class APITestRunner:
             assert framework.before_mutation is None
             assert framework.after_mutation is None
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "code_units_initialized": len(framework.code_units),
                 "test_cases_initialized": len(framework.test_cases),
                 "generated_tests_initialized": len(framework.generated_tests),
@@ -449,25 +530,26 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"State initialization test failed: {str(e)}")
+            errors.append(f"State initialization test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "framework_state_initialization",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_run_full_audit_method(self) -> Dict[str, Any]:
         """Test run_full_audit() method with mock LLM provider"""
-        results = {
-            "test_name": "run_full_audit_method",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
             framework = TestingFramework(project_path=project_path)
             
             # Patch framework with mock LLM
-            from mock_llm_provider import patch_framework_with_mock
             mock_provider = patch_framework_with_mock(framework)
             
             # Run full audit with limited parameters to avoid long execution
@@ -494,8 +576,8 @@ class APITestRunner:
             mock_stats = mock_provider.get_call_statistics()
             assert mock_stats["total_calls"] > 0  # Should have made LLM calls
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "audit_report_generated": audit_report is not None,
                 "project_name": audit_report.project_name,
                 "code_units_discovered": len(framework.code_units),
@@ -508,145 +590,86 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Full audit test failed: {str(e)}")
+            errors.append(f"Full audit test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "run_full_audit_method",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_individual_agent_methods(self) -> Dict[str, Any]:
         """Test individual agent method calls"""
-        results = {
-            "test_name": "individual_agent_methods",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
             framework = TestingFramework(project_path=project_path)
             
             # Patch framework with mock LLM
-            from mock_llm_provider import patch_framework_with_mock
             mock_provider = patch_framework_with_mock(framework)
             
-            agent_results = {}
-            
             # Test CodeMapperAgent.map_codebase()
-            try:
-                code_units = framework.code_mapper.map_codebase(framework.source_path)
-                agent_results["code_mapper"] = {
-                    "success": True,
-                    "code_units_found": len(code_units),
-                    "error": None
-                }
-                framework.code_units = code_units  # Store for other tests
-            except Exception as e:
-                agent_results["code_mapper"] = {
-                    "success": False,
-                    "code_units_found": 0,
-                    "error": str(e)
-                }
+            def run_code_mapper():
+                framework.code_units = framework.code_mapper.map_codebase(framework.source_path)
+                return {"code_units_found": len(framework.code_units)}
             
             # Test TestDiscoveryAgent.discover_tests()
-            try:
-                test_cases = framework.test_discovery.discover_tests(framework.test_path)
-                agent_results["test_discovery"] = {
-                    "success": True,
-                    "test_cases_found": len(test_cases),
-                    "error": None
-                }
-                framework.test_cases = test_cases  # Store for other tests
-            except Exception as e:
-                agent_results["test_discovery"] = {
-                    "success": False,
-                    "test_cases_found": 0,
-                    "error": str(e)
-                }
+            def run_test_discovery():
+                framework.test_cases = framework.test_discovery.discover_tests(framework.test_path)
+                return {"test_cases_found": len(framework.test_cases)}
             
             # Test TestAssessorAgent.assess_quality()
-            try:
-                if framework.code_units and framework.test_cases:
-                    quality_metrics = framework.test_assessor.assess_quality(
-                        framework.code_units, framework.test_cases
-                    )
-                    agent_results["test_assessor"] = {
-                        "success": True,
-                        "coverage_percentage": quality_metrics.coverage_percentage,
-                        "total_tests": quality_metrics.total_tests,
-                        "error": None
-                    }
-                else:
-                    agent_results["test_assessor"] = {
-                        "success": False,
-                        "coverage_percentage": 0,
-                        "total_tests": 0,
-                        "error": "No code units or test cases available"
-                    }
-            except Exception as e:
-                agent_results["test_assessor"] = {
-                    "success": False,
-                    "coverage_percentage": 0,
-                    "total_tests": 0,
-                    "error": str(e)
+            def run_test_assessor():
+                if not (framework.code_units and framework.test_cases):
+                    raise _StageSkipped("No code units or test cases available")
+                quality_metrics = framework.test_assessor.assess_quality(
+                    framework.code_units, framework.test_cases
+                )
+                return {
+                    "coverage_percentage": quality_metrics.coverage_percentage,
+                    "total_tests": quality_metrics.total_tests
                 }
             
             # Test TestGeneratorAgent.generate_tests()
-            try:
-                if framework.code_units:
-                    generated_tests = framework.test_generator.generate_tests(
-                        framework.code_units[0], framework.test_cases
-                    )
-                    agent_results["test_generator"] = {
-                        "success": True,
-                        "tests_generated": len(generated_tests),
-                        "error": None
-                    }
-                else:
-                    agent_results["test_generator"] = {
-                        "success": False,
-                        "tests_generated": 0,
-                        "error": "No code units available"
-                    }
-            except Exception as e:
-                agent_results["test_generator"] = {
-                    "success": False,
-                    "tests_generated": 0,
-                    "error": str(e)
-                }
+            def run_test_generator():
+                if not framework.code_units:
+                    raise _StageSkipped(_MSG_NO_UNITS)
+                generated_tests = framework.test_generator.generate_tests(
+                    framework.code_units[0], framework.test_cases
+                )
+                return {"tests_generated": len(generated_tests)}
             
             # Test TestJudgeAgent.judge_test()
-            try:
-                if framework.test_cases and framework.code_units:
-                    judgment = framework.test_judge.judge_test(
-                        framework.test_cases[0], framework.code_units[0]
-                    )
-                    agent_results["test_judge"] = {
-                        "success": True,
-                        "judgment_provided": judgment is not None,
-                        "overall_score": judgment.get("overall_score", 0),
-                        "error": None
-                    }
-                else:
-                    agent_results["test_judge"] = {
-                        "success": False,
-                        "judgment_provided": False,
-                        "overall_score": 0,
-                        "error": "No test cases or code units available"
-                    }
-            except Exception as e:
-                agent_results["test_judge"] = {
-                    "success": False,
-                    "judgment_provided": False,
-                    "overall_score": 0,
-                    "error": str(e)
+            def run_test_judge():
+                if not (framework.test_cases and framework.code_units):
+                    raise _StageSkipped("No test cases or code units available")
+                judgment = framework.test_judge.judge_test(
+                    framework.test_cases[0], framework.code_units[0]
+                )
+                return {
+                    "judgment_provided": judgment is not None,
+                    "overall_score": judgment.get("overall_score", 0)
                 }
             
+            # Agents run in order: later ones use the units and tests stored by earlier ones
+            agent_results = {
+                "code_mapper": _run_stage(run_code_mapper, {"code_units_found": 0}),
+                "test_discovery": _run_stage(run_test_discovery, {"test_cases_found": 0}),
+                "test_assessor": _run_stage(run_test_assessor, {"coverage_percentage": 0, "total_tests": 0}),
+                "test_generator": _run_stage(run_test_generator, {"tests_generated": 0}),
+                "test_judge": _run_stage(run_test_judge, {"judgment_provided": False, "overall_score": 0})
+            }
+            
             # Check overall success
             successful_agents = sum(1 for result in agent_results.values() if result["success"])
             total_agents = len(agent_results)
             
-            results["passed"] = successful_agents >= total_agents * 0.8  # 80% success rate
-            results["details"] = {
+            passed = successful_agents >= total_agents * 0.8  # 80% success rate
+            details = {
                 "total_agents_tested": total_agents,
                 "successful_agents": successful_agents,
                 "success_rate": (successful_agents / total_agents) * 100,
@@ -655,25 +678,26 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Individual agent methods test failed: {str(e)}")
+            errors.append(f"Individual agent methods test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "individual_agent_methods",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_audit_report_generation(self) -> Dict[str, Any]:
         """Test audit report generation and file saving"""
-        results = {
-            "test_name": "audit_report_generation",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
             framework = TestingFramework(project_path=project_path)
             
             # Patch framework with mock LLM
-            from mock_llm_provider import patch_framework_with_mock
             mock_provider = patch_framework_with_mock(framework)
             
             # Set up some basic state for report generation
@@ -709,8 +733,8 @@ class APITestRunner:
             markdown_files = list(reports_dir.glob("audit_report_*.md"))
             json_files = list(reports_dir.glob("audit_data_*.json"))
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "audit_report_created": audit_report is not None,
                 "project_name": audit_report.project_name,
                 "has_before_metrics": audit_report.before_metrics is not None,
@@ -724,154 +748,110 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Audit report generation test failed: {str(e)}")
+            errors.append(f"Audit report generation test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "audit_report_generation",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_framework_workflow_integration(self) -> Dict[str, Any]:
         """Test integration of framework workflow stages"""
-        results = {
-            "test_name": "framework_workflow_integration",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
             framework = TestingFramework(project_path=project_path)
             
             # Patch framework with mock LLM
-            from mock_llm_provider import patch_framework_with_mock
             mock_provider = patch_framework_with_mock(framework)
             
             workflow_stages = {}
+            stage_mask = 0  # bit i is set when stage i + 1 succeeds
+            
+            # Stages 1 and 2 walk disjoint trees (src/ and tests/), so run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                mapping_future = executor.submit(framework.code_mapper.map_codebase, framework.source_path)
+                discovery_future = executor.submit(framework.test_discovery.discover_tests, framework.test_path)
             
             # Stage 1: Codebase Mapping
-            try:
-                framework.code_units = framework.code_mapper.map_codebase(framework.source_path)
-                workflow_stages["codebase_mapping"] = {
-                    "success": True,
-                    "code_units": len(framework.code_units),
-                    "error": None
-                }
-            except Exception as e:
-                workflow_stages["codebase_mapping"] = {
-                    "success": False,
-                    "code_units": 0,
-                    "error": str(e)
-                }
+            def run_codebase_mapping():
+                framework.code_units = mapping_future.result()
+                return {"code_units": len(framework.code_units)}
             
             # Stage 2: Test Discovery
-            try:
-                framework.test_cases = framework.test_discovery.discover_tests(framework.test_path)
-                workflow_stages["test_discovery"] = {
-                    "success": True,
-                    "test_cases": len(framework.test_cases),
-                    "error": None
-                }
-            except Exception as e:
-                workflow_stages["test_discovery"] = {
-                    "success": False,
-                    "test_cases": 0,
-                    "error": str(e)
-                }
+            def run_test_discovery():
+                framework.test_cases = discovery_future.result()
+                return {"test_cases": len(framework.test_cases)}
             
             # Stage 3: Initial Quality Assessment
-            try:
-                if framework.code_units and framework.test_cases:
-                    framework.before_metrics = framework.test_assessor.assess_quality(
-                        framework.code_units, framework.test_cases
-                    )
-                    workflow_stages["initial_assessment"] = {
-                        "success": True,
-                        "coverage": framework.before_metrics.coverage_percentage,
-                        "error": None
-                    }
-                else:
-                    workflow_stages["initial_assessment"] = {
-                        "success": False,
-                        "coverage": 0,
-                        "error": "No code units or test cases"
-                    }
-            except Exception as e:
-                workflow_stages["initial_assessment"] = {
-                    "success": False,
-                    "coverage": 0,
-                    "error": str(e)
-                }
+            def run_initial_assessment():
+                if not (framework.code_units and framework.test_cases):
+                    raise _StageSkipped(_MSG_NO_UNITS_OR_TESTS)
+                framework.before_metrics = framework.test_assessor.assess_quality(
+                    framework.code_units, framework.test_cases
+                )
+                return {"coverage": framework.before_metrics.coverage_percentage}
             
             # Stage 4: Test Generation (simplified)
-            try:
-                if framework.code_units:
-                    generated_tests = framework.test_generator.generate_tests(
-                        framework.code_units[0], framework.test_cases
-                    )
-                    framework.generated_tests.extend(generated_tests)
-                    workflow_stages["test_generation"] = {
-                        "success": True,
-                        "generated_tests": len(generated_tests),
-                        "error": None
-                    }
-                else:
-                    workflow_stages["test_generation"] = {
-                        "success": False,
-                        "generated_tests": 0,
-                        "error": "No code units available"
-                    }
-            except Exception as e:
-                workflow_stages["test_generation"] = {
-                    "success": False,
-                    "generated_tests": 0,
-                    "error": str(e)
-                }
+            def run_test_generation():
+                if not framework.code_units:
+                    raise _StageSkipped(_MSG_NO_UNITS)
+                generated_tests = framework.test_generator.generate_tests(
+                    framework.code_units[0], framework.test_cases
+                )
+                framework.generated_tests.extend(generated_tests)
+                return {"generated_tests": len(generated_tests)}
             
             # Stage 5: Final Assessment
-            try:
-                if framework.code_units:
+            def run_final_assessment():
+                if not framework.code_units:
+                    raise _StageSkipped(_MSG_NO_UNITS)
+                # Without generated tests the inputs match Stage 3, so reuse its metrics
+                if not framework.generated_tests and framework.before_metrics is not None:
+                    framework.after_metrics = framework.before_metrics
+                    cache_status = "hit"
+                else:
                     all_tests = framework.test_cases + framework.generated_tests
                     framework.after_metrics = framework.test_assessor.assess_quality(
                         framework.code_units, all_tests
                     )
-                    workflow_stages["final_assessment"] = {
-                        "success": True,
-                        "final_coverage": framework.after_metrics.coverage_percentage,
-                        "error": None
-                    }
-                else:
-                    workflow_stages["final_assessment"] = {
-                        "success": False,
-                        "final_coverage": 0,
-                        "error": "No code units available"
-                    }
-            except Exception as e:
-                workflow_stages["final_assessment"] = {
-                    "success": False,
-                    "final_coverage": 0,
-                    "error": str(e)
+                    cache_status = "miss"
+                return {
+                    "final_coverage": framework.after_metrics.coverage_percentage,
+                    "cache": cache_status
                 }
             
             # Stage 6: Report Generation
-            try:
+            def run_report_generation():
                 audit_report = framework._generate_audit_report()
-                workflow_stages["report_generation"] = {
-                    "success": True,
-                    "report_created": audit_report is not None,
-                    "error": None
-                }
-            except Exception as e:
-                workflow_stages["report_generation"] = {
-                    "success": False,
-                    "report_created": False,
-                    "error": str(e)
-                }
+                return {"report_created": audit_report is not None}
+            
+            # (stage name, stage callable, fields recorded when the stage fails)
+            stages = (
+                ("codebase_mapping", run_codebase_mapping, {"code_units": 0}),
+                ("test_discovery", run_test_discovery, {"test_cases": 0}),
+                ("initial_assessment", run_initial_assessment, {"coverage": 0}),
+                ("test_generation", run_test_generation, {"generated_tests": 0}),
+                ("final_assessment", run_final_assessment, {"final_coverage": 0}),
+                ("report_generation", run_report_generation, {"report_created": False})
+            )
+            
+            for index, (stage_name, run_stage, failure_fields) in enumerate(stages):
+                workflow_stages[stage_name] = _run_stage(run_stage, failure_fields)
+                if workflow_stages[stage_name]["success"]:
+                    stage_mask |= 1 << index
             
             # Calculate overall success
-            successful_stages = sum(1 for stage in workflow_stages.values() if stage["success"])
+            successful_stages = stage_mask.bit_count()
             total_stages = len(workflow_stages)
             
-            results["passed"] = successful_stages >= total_stages * 0.8  # 80% success rate
-            results["details"] = {
+            passed = successful_stages >= total_stages * 0.8  # 80% success rate
+            details = {
                 "total_stages": total_stages,
                 "successful_stages": successful_stages,
                 "success_rate": (successful_stages / total_stages) * 100,
@@ -880,18 +860,20 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Workflow integration test failed: {str(e)}")
+            errors.append(f"Workflow integration test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "framework_workflow_integration",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_automatic_provider_detection(self) -> Dict[str, Any]:
         """Test automatic provider detection from existing llm_config.py"""
-        results = {
-            "test_name": "automatic_provider_detection",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             # Test LLMConfig provider detection
@@ -915,8 +897,7 @@ class APITestRunner:
             framework = TestingFramework(project_path=project_path)  # Should auto-detect
             
             # Validate that framework used detected provider
-            assert framework.llm is not None
-            assert framework.llm_config is not None
+            assert _framework_ready(framework), "framework LLM not initialized"
             
             # Test with explicit provider specification
             framework_explicit = TestingFramework(
@@ -924,10 +905,10 @@ class APITestRunner:
                 provider=default_provider
             )
             
-            assert framework_explicit.llm is not None
+            assert _framework_ready(framework_explicit), "explicit-provider framework LLM not initialized"
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "detection_results": detection_results,
                 "auto_detection_works": framework.llm is not None,
                 "explicit_provider_works": framework_explicit.llm is not None,
@@ -936,35 +917,31 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Automatic provider detection test failed: {str(e)}")
+            errors.append(f"Automatic provider detection test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "automatic_provider_detection",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_fallback_behavior_missing_credentials(self) -> Dict[str, Any]:
         """Test fallback behavior when credentials are missing"""
-        results = {
-            "test_name": "fallback_behavior_missing_credentials",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
-            # Save original environment
-            import os
-            original_env = {}
-            api_keys = [
-                "OPENAI_API_KEY", "AZURE_API_KEY", "ANTHROPIC_API_KEY", 
-                "GOOGLE_API_KEY", "COHERE_API_KEY"
-            ]
-            
-            for key in api_keys:
-                original_env[key] = os.environ.get(key)
-                # Temporarily remove API keys
-                if key in os.environ:
-                    del os.environ[key]
-            
-            try:
+            # Temporarily remove API keys; patch.dict restores the environment on exit
+            with patch.dict(os.environ), _default_socket_timeout(0.5):
+                for key in _PROVIDER_ENV_KEYS:
+                    os.environ.pop(key, None)
+                
+                # Nothing here needs the network: keep CrewAI telemetry off, and the
+                # socket timeout bounds anything else that tries to connect
+                os.environ["OTEL_SDK_DISABLED"] = "true"
+                
                 # Test LLMConfig behavior with no credentials
                 llm_config = LLMConfig()
                 available_providers = llm_config.get_available_providers()
@@ -1004,36 +981,30 @@ class APITestRunner:
                     provider_specific_behavior["framework_created"] = False
                     provider_specific_behavior["error"] = str(e)
                 
-                results["passed"] = True  # Any behavior is acceptable as long as it's consistent
-                results["details"] = {
+                passed = True  # Any behavior is acceptable as long as it's consistent
+                details = {
                     "real_providers_available": real_providers_available,
                     "available_providers": {k.value: v for k, v in available_providers.items()},
                     "fallback_behavior": fallback_behavior,
                     "provider_specific_behavior": provider_specific_behavior,
                     "test_note": "Any consistent behavior (error or fallback) is acceptable"
                 }
-                
-            finally:
-                # Restore original environment
-                for key, value in original_env.items():
-                    if value is not None:
-                        os.environ[key] = value
-                    elif key in os.environ:
-                        del os.environ[key]
             
         except Exception as e:
-            results["errors"].append(f"Fallback behavior test failed: {str(e)}")
+            errors.append(f"Fallback behavior test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "fallback_behavior_missing_credentials",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_mock_provider_integration(self) -> Dict[str, Any]:
         """Test with mock provider to avoid API calls during testing"""
-        results = {
-            "test_name": "mock_provider_integration",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("partial")
@@ -1041,8 +1012,7 @@ class APITestRunner:
             # Test 1: Framework with mock provider
             framework = TestingFramework(project_path=project_path)
             
-            # Patch with mock provider
-            from mock_llm_provider import patch_framework_with_mock
+            # Patch with mock provider; agents share it, so identical prompts are served from its response cache
             mock_provider = patch_framework_with_mock(framework)
             
             # Validate mock provider integration
@@ -1051,19 +1021,18 @@ class APITestRunner:
             assert hasattr(mock_provider, 'get_call_statistics')
             
             # Test mock provider responses
-            test_prompt = "Generate test for function add(a, b)"
-            response = mock_provider.invoke(test_prompt)
+            initial_stats = mock_provider.get_call_statistics()
+            response, _ = mock_provider.invoke_many([
+                "Generate test for function add(a, b)",
+                "Evaluate test quality"
+            ])
+            updated_stats = mock_provider.get_call_statistics()
+            
             assert response is not None
             assert hasattr(response, 'content')
             assert len(response.content) > 0
             
             # Test call tracking
-            initial_stats = mock_provider.get_call_statistics()
-            
-            # Make another call
-            response2 = mock_provider.invoke("Evaluate test quality")
-            updated_stats = mock_provider.get_call_statistics()
-            
             assert updated_stats["total_calls"] > initial_stats["total_calls"]
             
             # Test 2: Framework operations with mock provider
@@ -1099,20 +1068,13 @@ class APITestRunner:
             
             # Test 3: Mock provider response types
             response_types = {}
-            test_prompts = {
-                "test_generation": "Generate comprehensive test cases for function calculate()",
-                "test_judgment": "Evaluate the following test case for quality",
-                "audit_report": "Generate audit report for testing improvements",
-                "code_analysis": "Analyze the structure of this Python code"
-            }
-            
-            for prompt_type, prompt in test_prompts.items():
+            for prompt_type, prompt in _RESPONSE_TYPE_PROMPTS:
                 try:
-                    response = mock_provider.invoke(prompt)
+                    content = getattr(mock_provider.invoke(prompt), 'content', None)
                     response_types[prompt_type] = {
                         "success": True,
-                        "has_content": hasattr(response, 'content'),
-                        "content_length": len(response.content) if hasattr(response, 'content') else 0,
+                        "has_content": content is not None,
+                        "content_length": len(content) if content else 0,
                         "error": None
                     }
                 except Exception as e:
@@ -1125,8 +1087,8 @@ class APITestRunner:
             
             final_stats = mock_provider.get_call_statistics()
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "mock_provider_created": mock_provider is not None,
                 "mock_provider_type": type(mock_provider).__name__,
                 "response_validation": {
@@ -1145,18 +1107,20 @@ class APITestRunner:
             }
             
         except Exception as e:
-            results["errors"].append(f"Mock provider integration test failed: {str(e)}")
+            errors.append(f"Mock provider integration test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "mock_provider_integration",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
     
     def test_provider_configuration_validation(self) -> Dict[str, Any]:
         """Test provider configuration validation and error handling"""
-        results = {
-            "test_name": "provider_configuration_validation",
-            "passed": False,
-            "errors": [],
-            "details": {}
-        }
+        passed = False
+        errors = []
+        details = {}
         
         try:
             project_path = self.create_temp_project("empty")
@@ -1167,28 +1131,6 @@ class APITestRunner:
             # Test 1: Valid provider configurations
             valid_providers = [Provider.OPENAI, Provider.AZURE_OPENAI, Provider.ANTHROPIC]
             
-            for provider in valid_providers:
-                try:
-                    framework = TestingFramework(
-                        project_path=project_path,
-                        provider=provider,
-                        model="test-model",
-                        temperature=0.1
-                    )
-                    configuration_tests[f"valid_{provider.value}"] = {
-                        "success": True,
-                        "framework_created": framework is not None,
-                        "llm_created": framework.llm is not None,
-                        "error": None
-                    }
-                except Exception as e:
-                    configuration_tests[f"valid_{provider.value}"] = {
-                        "success": False,
-                        "framework_created": False,
-                        "llm_created": False,
-                        "error": str(e)
-                    }
-            
             # Test 2: Invalid configurations
             invalid_configs = [
                 {"provider": None, "model": None, "temperature": 2.0},  # Invalid temperature
@@ -1196,21 +1138,34 @@ class APITestRunner:
                 {"provider": Provider.CUSTOM, "model": "custom-model", "temperature": -0.1}  # Invalid temp
             ]
             
-            for i, config in enumerate(invalid_configs):
+            # (configuration name, framework kwargs, whether an error counts as success)
+            configurations = [
+                (f"valid_{provider.value}",
+                 {"provider": provider, "model": "test-model", "temperature": 0.1},
+                 False)
+                for provider in valid_providers
+            ] + [
+                (f"invalid_config_{i}", config, True)  # Expected to raise error or handle gracefully
+                for i, config in enumerate(invalid_configs)
+            ]
+            
+            for config_name, config, error_expected in configurations:
                 try:
                     framework = TestingFramework(
                         project_path=project_path,
                         **config
                     )
-                    configuration_tests[f"invalid_config_{i}"] = {
-                        "success": True,  # Framework handles gracefully
+                    configuration_tests[config_name] = {
+                        "success": True,
                         "framework_created": framework is not None,
+                        "llm_created": framework.llm is not None,
                         "error": None
                     }
                 except Exception as e:
-                    configuration_tests[f"invalid_config_{i}"] = {
-                        "success": True,  # Expected to raise error
+                    configuration_tests[config_name] = {
+                        "success": error_expected,
                         "framework_created": False,
+                        "llm_created": False,
                         "error": str(e)
                     }
             
@@ -1238,73 +1193,57 @@ class APITestRunner:
                     "error": str(e)
                 }
             
-            results["passed"] = True
-            results["details"] = {
+            passed = True
+            details = {
                 "configuration_tests": configuration_tests,
                 "config_validation": config_validation,
                 "total_configurations_tested": len(configuration_tests)
             }
             
         except Exception as e:
-            results["errors"].append(f"Provider configuration validation test failed: {str(e)}")
+            errors.append(f"Provider configuration validation test failed: {str(e)}")
         
-        return results
+        return {
+            "test_name": "provider_configuration_validation",
+            "passed": passed,
+            "errors": errors,
+            "details": details
+        }
 
+    def _run_single_test(self, test_method) -> Dict[str, Any]:
+        """Run one test method, converting unexpected exceptions into a failed result"""
+        try:
+            return test_method()
+        except Exception as e:
+            return {
+                "test_name": test_method.__name__,
+                "passed": False,
+                "errors": [f"Test execution failed: {str(e)}"],
+                "details": {}
+            }
+    
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all API interface validation tests"""
         self.setup_test_environment()
         
         try:
-            test_methods = [
-                self.test_framework_initialization_default,
-                self.test_framework_initialization_with_provider,
-                self.test_framework_initialization_invalid_path,
-                self.test_agent_creation_and_configuration,
-                self.test_llm_provider_detection,
-                self.test_error_handling_invalid_configurations,
-                self.test_framework_state_initialization,
-                # New workflow tests
-                self.test_run_full_audit_method,
-                self.test_individual_agent_methods,
-                self.test_audit_report_generation,
-                self.test_framework_workflow_integration,
-                # New LLM provider integration tests
-                self.test_automatic_provider_detection,
-                self.test_fallback_behavior_missing_credentials,
-                self.test_mock_provider_integration,
-                self.test_provider_configuration_validation
+            # Tests run one at a time: building a TestingFramework or LLMConfig
+            # loads .env and sets up provider variables in os.environ
+            test_results = [
+                self._run_single_test(getattr(self, name))
+                for name in self.TEST_METHOD_NAMES
             ]
+            passed_tests = sum(1 for test_result in test_results if test_result["passed"])
             
             results = {
                 "test_suite": "API Interface Validation",
-                "total_tests": len(test_methods),
-                "passed_tests": 0,
-                "failed_tests": 0,
-                "test_results": []
+                "total_tests": len(test_results),
+                "passed_tests": passed_tests,
+                "failed_tests": len(test_results) - passed_tests,
+                "test_results": test_results,
+                "success_rate": (passed_tests / (len(test_results) or 1)) * 100
             }
             
-            for test_method in test_methods:
-                try:
-                    test_result = test_method()
-                    results["test_results"].append(test_result)
-                    
-                    if test_result["passed"]:
-                        results["passed_tests"] += 1
-                    else:
-                        results["failed_tests"] += 1
-                        
-                except Exception as e:
-                    error_result = {
-                        "test_name": test_method.__name__,
-                        "passed": False,
-                        "errors": [f"Test execution failed: {str(e)}"],
-                        "details": {}
-                    }
-                    results["test_results"].append(error_result)
-                    results["failed_tests"] += 1
-            
-            results["success_rate"] = (results["passed_tests"] / results["total_tests"]) * 100
-            
             return results
             
         finally:
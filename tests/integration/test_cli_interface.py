@@ -4,31 +4,179 @@ CLI Interface Validation Tests
 Tests for validating the command-line interface functionality of the framework.
 """
 
+import asyncio
+import atexit
+import select
+import signal
 import subprocess
 import sys
-import tempfile
+import threading
 import shutil
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import json
-import time
-import signal
 import os
 
 import pytest
 
-import sys
-from pathlib import Path
+# Repository root, from which `python -m src` resolves the framework package
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Script run by _PersistentCLIHost
+_CLI_HOST_SCRIPT = Path(__file__).parent.parent / "cli_host.py"
+
+# Selects how CLI commands run: "subprocess" (default) starts a fresh
+# `python -m src` per command; "host" sends them to one persistent host
+_CLI_BACKEND_VAR = "CLI_TEST_BACKEND"
+
+
+# Output keywords checked by the tests
+_ANALYSIS_INDICATORS = (
+    "Mapping", "Discovering", "Assessing", "Error", "Framework",
+    "project", "analysis", "codebase", "test"
+)
+_GEN_INDICATORS = (
+    "generating", "generated", "uncovered", "units", "mapping",
+    "discovering", "test", "framework", "error"
+)
+_GEN_KEYWORDS = ("generating", "generated", "creating")
+_COVERAGE_KEYWORDS = ("coverage", "covered", "uncovered")
+_EXPECTED_SECTIONS = ("Codebase", "Test", "Quality", "Metrics")
+_PROGRESS_INDICATORS = ("Found", "Generating", "Generated", "✅", "❌")
+_EMOJI_PATTERNS = ("📊", "🔍", "📈")
+
+
+def _kill_process_group(process):
+    """Kill a child started with start_new_session=True and all its descendants
+    
+    Falls back to killing just the child where process groups are unavailable.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            return
+        except OSError:
+            pass
+    process.kill()
+
+
+class OutputValidation(NamedTuple):
+    """Result of CLITestRunner.validate_output_format"""
+    has_output: bool
+    no_python_errors: bool
+    has_progress_indicators: bool
+    has_structured_output: bool
+    proper_error_format: bool
+
+
+class ReportValidation(NamedTuple):
+    """Result of CLITestRunner.check_report_generation"""
+    reports_dir_exists: bool
+    has_markdown_reports: bool = False
+    has_json_reports: bool = False
+    reports_have_timestamps: bool = False
+
+
+class _PersistentCLIHost:
+    """Long-lived tests/cli_host.py worker shared by every CLITestRunner
+    
+    The host imports the CLI once and runs each command in-process, so only the
+    first command of a session pays interpreter and import start-up. Commands
+    share the host's module state, so this backend is opt-in.
+    """
+    
+    _instance = None
+    
+    # Seconds allowed for the host to import the CLI, separate from any
+    # command's own timeout
+    STARTUP_TIMEOUT = 120
+    
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", str(_CLI_HOST_SCRIPT)],
+            cwd=_PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        
+        ready, _, _ = select.select([self.process.stdout], [], [], self.STARTUP_TIMEOUT)
+        if not ready or self.process.stdout.readline() != b"ready\n":
+            _kill_process_group(self.process)
+            self.process.wait()
+            raise RuntimeError("CLI host failed to start")
+    
+    @classmethod
+    def get(cls) -> "_PersistentCLIHost":
+        """Return the shared host, starting a new one if none is running"""
+        if cls._instance is None or cls._instance.process.poll() is not None:
+            cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def shutdown(cls):
+        """Stop the shared host if one was started"""
+        if cls._instance is not None:
+            cls._instance.close()
+            cls._instance = None
+    
+    def close(self):
+        """Close the host's stdin and wait for it to exit"""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+    
+    def execute(self, frame: Dict, timeout: int) -> Tuple[int, str, str]:
+        """Send one command frame and wait for its length-prefixed reply
+        
+        Raises:
+            subprocess.TimeoutExpired: If no reply arrives within timeout.
+                The host is killed so the next command starts a fresh one.
+            RuntimeError: If the host exits before replying.
+        """
+        self.process.stdin.write((json.dumps(frame) + "\n").encode("utf-8"))
+        self.process.stdin.flush()
+        
+        ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+        if not ready:
+            _kill_process_group(self.process)
+            self.process.wait()
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        
+        header = self.process.stdout.readline()
+        if not header:
+            raise RuntimeError("CLI host exited unexpectedly")
+        
+        # Buffered read returns the full payload unless the host exits mid-reply
+        size = int(header)
+        payload = self.process.stdout.read(size)
+        if len(payload) < size:
+            raise RuntimeError("CLI host exited unexpectedly")
+        
+        reply = json.loads(payload)
+        return reply["rc"], reply["stdout"], reply["stderr"]
 
-# Add the tests directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fixtures.fixture_manager import FixtureManager
+atexit.register(_PersistentCLIHost.shutdown)
 
 
 class CLITestRunner:
     """Test runner for CLI command validation with subprocess execution"""
     
+    # Output patterns checked by validate_output_format, one scan per category
+    _PROGRESS_MARKERS = ("📊", "🔍", "📈", "🎯", "✅", "❌", "Mapping", "Discovering", "Assessing")
+    _STRUCTURE_MARKERS = ("Audit Results", "Analysis", "Generated", "Codebase", "Test", "Quality")
+    
+    # Command prefix for running the framework CLI in a fresh interpreter
+    _PREFIX = (sys.executable, "-m", "src")
+    
     def __init__(self, timeout_seconds: int = 300):
         """Initialize CLI test runner
         
@@ -36,19 +184,27 @@ class CLITestRunner:
             timeout_seconds: Default timeout for CLI commands
         """
         self.timeout_seconds = timeout_seconds
-        self.fixture_manager = FixtureManager()
+        # Live view of the process environment; copied only when a command
+        # needs overrides, otherwise children simply inherit it
+        self._base_env = os.environ
         
-    def run_command(
-        self, 
-        command: List[str], 
+    def run_command_streaming(
+        self,
+        command: List[str],
+        tail: Optional[int] = None,
         cwd: Optional[Path] = None,
         timeout: Optional[int] = None,
         env: Optional[Dict[str, str]] = None
     ) -> Tuple[int, str, str]:
-        """Execute a CLI command and capture output
+        """Execute a CLI command, streaming its output as it is produced
+        
+        The full output is kept by default, so checks for markers the CLI
+        prints early still see them. Passing `tail` keeps only that many
+        trailing lines per stream, bounding memory for very verbose commands.
         
         Args:
             command: Command and arguments to execute
+            tail: Maximum number of trailing lines kept per stream (None keeps all)
             cwd: Working directory for command execution
             timeout: Command timeout in seconds
             env: Environment variables for the command
@@ -59,36 +215,211 @@ class CLITestRunner:
         if timeout is None:
             timeout = self.timeout_seconds
             
-        # Prepare environment
-        cmd_env = os.environ.copy()
-        if env:
-            cmd_env.update(env)
-            
+        cmd_env = {**self._base_env, **env} if env else None
+        
         try:
-            # Execute command with timeout
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
                 cwd=cwd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
                 text=True,
-                timeout=timeout,
-                env=cmd_env
+                errors="replace",
+                env=cmd_env,
+                start_new_session=True
             )
+        except FileNotFoundError:
+            return -1, "", f"Command not found: {' '.join(command)}"
+        except Exception as e:
+            return -1, "", f"Command execution error: {str(e)}"
+        
+        def pump(stream, lines: deque):
+            for line in stream:
+                lines.append(line)
+            stream.close()
+        
+        stdout_lines: deque = deque(maxlen=tail)
+        stderr_lines: deque = deque(maxlen=tail)
+        readers = [
+            threading.Thread(target=pump, args=(process.stdout, stdout_lines), daemon=True),
+            threading.Thread(target=pump, args=(process.stderr, stderr_lines), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Killing the whole group also closes pipes held by grandchildren,
+            # which would otherwise keep the reader threads blocked
+            _kill_process_group(process)
+            process.wait()
+            for reader in readers:
+                reader.join()
+            return -1, "".join(stdout_lines), f"Command timed out after {timeout} seconds"
+        
+        for reader in readers:
+            reader.join()
+        
+        return process.returncode, "".join(stdout_lines), "".join(stderr_lines)
+    
+    async def run_command_async(
+        self,
+        command: List[str],
+        cwd: Optional[Path] = None,
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, str]:
+        """Execute a CLI command without blocking the event loop
+        
+        Args:
+            command: Command and arguments to execute
+            cwd: Working directory for command execution
+            timeout: Command timeout in seconds
+            env: Environment variables for the command
+            
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        if timeout is None:
+            timeout = self.timeout_seconds
             
-            return result.returncode, result.stdout, result.stderr
+        cmd_env = {**self._base_env, **env} if env else None
             
-        except subprocess.TimeoutExpired:
-            return -1, "", f"Command timed out after {timeout} seconds"
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=cmd_env,
+                start_new_session=True
+            )
         except FileNotFoundError:
             return -1, "", f"Command not found: {' '.join(command)}"
         except Exception as e:
             return -1, "", f"Command execution error: {str(e)}"
+            
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            _kill_process_group(process)
+            await process.wait()
+            return -1, "", f"Command timed out after {timeout} seconds"
+            
+        return (
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace")
+        )
+    
+    def run_batch(self, specs: List[Dict]) -> List[Tuple[int, str, str]]:
+        """Run several CLI subcommands concurrently, one process each
+        
+        Every spec is a dict with "cmd" and "project_path" and optional
+        "flags", "timeout" and "env" entries. At most os.cpu_count() commands
+        run at once. Specs should not share a project directory, since the
+        commands write reports and tests into it.
+        
+        Args:
+            specs: Command specifications to run
+            
+        Returns:
+            List of (exit_code, stdout, stderr) tuples in spec order
+        """
+        async def run_one(spec: Dict, semaphore: asyncio.Semaphore) -> Tuple[int, str, str]:
+            command = [
+                *self._PREFIX, spec["cmd"], os.fspath(spec["project_path"]),
+                *spec.get("flags", ())
+            ]
+            async with semaphore:
+                return await self.run_command_async(
+                    command,
+                    cwd=_PROJECT_ROOT,
+                    timeout=spec.get("timeout"),
+                    env=spec.get("env")
+                )
+        
+        async def run_all() -> List[Tuple[int, str, str]]:
+            semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+            return await asyncio.gather(*(run_one(spec, semaphore) for spec in specs))
+        
+        return asyncio.run(run_all())
+    
+    def clone_project(self, project_path: Path, suffix: str) -> Path:
+        """Copy a project next to itself so commands can run on it concurrently
+        
+        Args:
+            project_path: Project to copy
+            suffix: Appended to the project directory name for the copy
+            
+        Returns:
+            Path to the copied project
+        """
+        clone_path = project_path.with_name(f"{project_path.name}_{suffix}")
+        shutil.copytree(project_path, clone_path)
+        return clone_path
+    
+    def run_cli_command(
+        self,
+        cmd: str,
+        project_path: Path,
+        flags: Optional[List[str]] = None,
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, str]:
+        """Run a framework CLI subcommand
+        
+        Each command runs in a fresh `python -m src` process. Setting
+        CLI_TEST_BACKEND=host sends commands to the shared persistent CLI host
+        instead, except on Windows, where the host's pipe polling is
+        unavailable. The host's start-up is not counted against the timeout.
+        
+        Args:
+            cmd: Subcommand name (audit, analyze or generate)
+            project_path: Path to the project the command operates on
+            flags: Additional command-line flags
+            timeout: Command timeout in seconds
+            env: Additional environment variables for the command
+            
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        flags = list(flags or [])
+        
+        if os.environ.get(_CLI_BACKEND_VAR) != "host" or os.name == "nt":
+            command = [*self._PREFIX, cmd, os.fspath(project_path), *flags]
+            return self.run_command_streaming(
+                command,
+                cwd=_PROJECT_ROOT,
+                timeout=timeout,
+                env=env
+            )
+        
+        if timeout is None:
+            timeout = self.timeout_seconds
+        
+        frame = {
+            "cmd": cmd,
+            "path": os.fspath(project_path),
+            "flags": flags,
+            "env": env or {}
+        }
+        
+        try:
+            return _PersistentCLIHost.get().execute(frame, timeout)
+        except subprocess.TimeoutExpired:
+            return -1, "", f"Command timed out after {timeout} seconds"
+        except Exception as e:
+            return -1, "", f"Command execution error: {str(e)}"
     
     def run_audit_command(
         self, 
         project_path: Path, 
         flags: Optional[List[str]] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None
     ) -> Tuple[int, str, str]:
         """Run the audit command with specified flags
         
@@ -96,16 +427,12 @@ class CLITestRunner:
             project_path: Path to project to audit
             flags: Additional command-line flags
             timeout: Command timeout in seconds
+            env: Additional environment variables for the command
             
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        command = [sys.executable, "-m", "src", "audit", str(project_path)]
-        
-        if flags:
-            command.extend(flags)
-            
-        return self.run_command(command, timeout=timeout)
+        return self.run_cli_command("audit", project_path, flags=flags, timeout=timeout, env=env)
     
     def run_analyze_command(
         self, 
@@ -121,8 +448,7 @@ class CLITestRunner:
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        command = [sys.executable, "-m", "src", "analyze", str(project_path)]
-        return self.run_command(command, timeout=timeout)
+        return self.run_cli_command("analyze", project_path, timeout=timeout)
     
     def run_generate_command(
         self, 
@@ -138,10 +464,9 @@ class CLITestRunner:
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        command = [sys.executable, "-m", "src", "generate", str(project_path)]
-        return self.run_command(command, timeout=timeout)
+        return self.run_cli_command("generate", project_path, timeout=timeout)
     
-    def validate_output_format(self, stdout: str, stderr: str) -> Dict[str, bool]:
+    def validate_output_format(self, stdout: str, stderr: str) -> OutputValidation:
         """Validate that CLI output follows expected format patterns
         
         Args:
@@ -149,89 +474,128 @@ class CLITestRunner:
             stderr: Standard error from command
             
         Returns:
-            Dictionary of validation results
+            OutputValidation with one flag per check
         """
         # Check for serious Python errors (excluding Unicode encoding issues on Windows)
-        has_serious_errors = (
-            "Traceback" in stderr and 
-            not ("UnicodeEncodeError" in stderr and "charmap" in stderr)
-        )
+        has_encoding_issue = "UnicodeEncodeError" in stderr and "charmap" in stderr
+        has_serious_errors = "Traceback" in stderr and not has_encoding_issue
         
-        validations = {
-            "has_output": bool(stdout.strip() or stderr.strip()),
-            "no_python_errors": not has_serious_errors,
-            "has_progress_indicators": any(
-                indicator in stdout 
-                for indicator in ["📊", "🔍", "📈", "🎯", "✅", "❌", "Mapping", "Discovering", "Assessing"]
-            ),
-            "has_structured_output": any(
-                section in stdout 
-                for section in ["Audit Results", "Analysis", "Generated", "Codebase", "Test", "Quality"]
-            ),
-            "proper_error_format": (
+        return OutputValidation(
+            # isspace() stops at the first visible character; strip() would
+            # copy the whole buffer whenever it ends in a newline
+            has_output=any(buf and not buf.isspace() for buf in (stdout, stderr)),
+            no_python_errors=not has_serious_errors,
+            has_progress_indicators=self.contains_any(self._PROGRESS_MARKERS, stdout),
+            has_structured_output=self.contains_any(self._STRUCTURE_MARKERS, stdout),
+            proper_error_format=(
                 stderr == "" or 
                 stderr.startswith("Error:") or 
                 "Usage:" in stderr or
-                ("UnicodeEncodeError" in stderr and "charmap" in stderr)  # Windows encoding issue
+                has_encoding_issue  # Windows encoding issue
             )
-        }
+        )
+    
+    @staticmethod
+    def _fold_case(buf: str) -> bytes:
+        """Lowercase a buffer for case-insensitive matching against ASCII needles
         
-        return validations
+        CLI output mixes ASCII text with emoji, which pushes str.lower() off
+        CPython's ASCII fast path; encoding to UTF-8 and lowercasing the bytes
+        is several times faster. bytes.lower() only folds A-Z, which is exact
+        for the ASCII keywords these helpers are used with.
+        """
+        return buf.encode("utf-8", "surrogatepass").lower()
     
-    def check_report_generation(self, project_path: Path) -> Dict[str, bool]:
-        """Check if reports were generated in the reports directory
+    def contains_any(self, needles: Tuple[str, ...], *bufs: str, ignore_case: bool = False) -> bool:
+        """Check whether any needle occurs in any of the buffers
+        
+        Buffers are searched separately rather than concatenated, and the
+        search stops at the first hit. Each needle uses str's substring
+        search, which is markedly faster on CLI output than a regex
+        alternation (and, for ignore_case, than re.IGNORECASE against a
+        lowercased buffer). Case-insensitive searches run on bytes, see
+        _fold_case.
         
         Args:
-            project_path: Path to project that was audited
+            needles: Literal substrings to look for
+            *bufs: Output buffers to search
+            ignore_case: Match regardless of case
             
         Returns:
-            Dictionary of report validation results
+            True if at least one needle was found
         """
-        reports_dir = project_path / "reports"
+        if ignore_case:
+            needles = tuple(self._fold_case(needle) for needle in needles)
         
-        validations = {
-            "reports_dir_exists": reports_dir.exists(),
-            "has_markdown_reports": False,
-            "has_json_reports": False,
-            "reports_have_timestamps": False
-        }
+        for buf in bufs:
+            if ignore_case:
+                buf = self._fold_case(buf)
+            if any(needle in buf for needle in needles):
+                return True
+        return False
+    
+    def output_excerpt(self, stdout: str, stderr: str, limit: int = 500) -> str:
+        """Return the first `limit` characters of stdout followed by stderr
         
-        if reports_dir.exists():
-            # Check for markdown reports
-            md_files = list(reports_dir.glob("audit_report_*.md"))
-            validations["has_markdown_reports"] = len(md_files) > 0
-            
-            # Check for JSON reports
-            json_files = list(reports_dir.glob("audit_data_*.json"))
-            validations["has_json_reports"] = len(json_files) > 0
+        Equivalent to (stdout + stderr)[:limit] without concatenating the
+        full buffers.
+        """
+        return (stdout[:limit] + stderr[:limit])[:limit]
+    
+    def count_matches(self, needles: Tuple[str, ...], *bufs: str, ignore_case: bool = False) -> int:
+        """Count needle occurrences across the buffers
+        
+        Matches sum(buf.count(needle)) over every needle and buffer.
+        Case-insensitive counts run on bytes, see _fold_case.
+        
+        Args:
+            needles: Literal substrings to count
+            *bufs: Output buffers to search
+            ignore_case: Match regardless of case
             
-            # Check for timestamp patterns
-            all_files = list(reports_dir.glob("*"))
-            validations["reports_have_timestamps"] = any(
-                "_20" in file.name for file in all_files
-            )
+        Returns:
+            Total number of occurrences
+        """
+        if ignore_case:
+            needles = tuple(self._fold_case(needle) for needle in needles)
+            bufs = tuple(self._fold_case(buf) for buf in bufs)
         
-        return validations
+        return sum(buf.count(needle) for buf in bufs for needle in needles)
     
-    def cleanup_generated_files(self, project_path: Path):
-        """Clean up any files generated during testing
+    def check_report_generation(self, project_path: Path) -> ReportValidation:
+        """Check if reports were generated in the reports directory
         
         Args:
-            project_path: Path to project to clean up
+            project_path: Path to project that was audited
+            
+        Returns:
+            ReportValidation with one flag per check
         """
-        # Remove reports directory if it was created during testing
         reports_dir = project_path / "reports"
-        if reports_dir.exists():
-            shutil.rmtree(reports_dir, ignore_errors=True)
-        
-        # Remove any generated test files
-        tests_dir = project_path / "tests"
-        if tests_dir.exists():
-            for test_file in tests_dir.glob("test_*.py"):
-                # Only remove files that look like they were generated
-                # (avoid removing existing test files)
-                if test_file.stat().st_mtime > time.time() - 3600:  # Modified in last hour
-                    test_file.unlink(missing_ok=True)
+        
+        if not reports_dir.exists():
+            return ReportValidation(reports_dir_exists=False)
+        
+        # Check markdown reports, JSON reports and timestamps in one pass
+        has_md = has_json = has_ts = False
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not has_md and name.startswith("audit_report_") and name.endswith(".md"):
+                    has_md = True
+                if not has_json and name.startswith("audit_data_") and name.endswith(".json"):
+                    has_json = True
+                if not has_ts and "_20" in name:
+                    has_ts = True
+                if has_md and has_json and has_ts:
+                    break
+        
+        return ReportValidation(
+            reports_dir_exists=True,
+            has_markdown_reports=has_md,
+            has_json_reports=has_json,
+            reports_have_timestamps=has_ts
+        )
 
 
 class TestCLIInterface:
@@ -240,119 +604,91 @@ class TestCLIInterface:
     def setup_method(self):
         """Set up test environment"""
         self.cli_runner = CLITestRunner(timeout_seconds=60)  # Shorter timeout for tests
-        self.temp_dir = None
     
-    def teardown_method(self):
-        """Clean up test environment"""
-        if self.temp_dir and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_audit_command_empty_project(self):
+    def test_audit_command_empty_project(self, empty_project):
         """Test audit command with empty project (no tests)"""
-        # Create temporary directory and empty project
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Set mock environment to avoid real LLM calls
-            env = {"TESTING_MODE": "true", "USE_MOCK_LLM": "true"}
-            
-            # Run audit command
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--verbose"],
-                timeout=30
-            )
-            
-            # Validate command execution
-            assert exit_code == 0 or exit_code == -1, f"Command failed with exit code {exit_code}: {stderr}"
-            
-            # Validate output format
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Command should produce output"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Mark the run as a test run; the CLI has no mock LLM switch, so the
+        # short timeout below bounds any provider calls
+        env = {"TESTING_MODE": "true"}
+        
+        # Run audit command
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--verbose"],
+            timeout=30,
+            env=env
+        )
+        
+        # Validate command execution
+        assert exit_code == 0 or exit_code == -1, f"Command failed with exit code {exit_code}: {stderr}"
+        
+        # Validate output format
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Command should produce output"
     
-    def test_audit_command_with_flags(self):
+    @pytest.mark.parametrize("flags", [
+        ["--no-generate"],
+        ["--no-mutation"],
+        ["--verbose"],
+        ["--no-generate", "--no-mutation"],
+        ["--verbose", "--no-generate"]
+    ])
+    def test_audit_command_with_flags(self, partial_project, flags):
         """Test audit command with various flags"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Test different flag combinations
-            flag_combinations = [
-                ["--no-generate"],
-                ["--no-mutation"],
-                ["--verbose"],
-                ["--no-generate", "--no-mutation"],
-                ["--verbose", "--no-generate"]
-            ]
-            
-            for flags in flag_combinations:
-                exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                    project_path, 
-                    flags=flags,
-                    timeout=30
-                )
-                
-                # Command should not crash
-                assert exit_code != -1, f"Command timed out or failed to execute with flags {flags}"
-                
-                # Should have some output
-                output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-                assert output_validation["has_output"], f"No output with flags {flags}"
-                
-                # Clean up between runs
-                self.cli_runner.cleanup_generated_files(project_path)
-    
-    def test_analyze_command(self):
+        project_path = partial_project
+        
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=flags,
+            timeout=30
+        )
+        
+        # Command should not crash
+        assert exit_code != -1, f"Command timed out or failed to execute with flags {flags}"
+        
+        # Should have some output
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, f"No output with flags {flags}"
+    
+    def test_analyze_command(self, partial_project):
         """Test analyze command for read-only analysis"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run analyze command
-            exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Validate execution
-            assert exit_code != -1, f"Analyze command failed: {stderr}"
-            
-            # Validate output
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Analyze command should produce output"
-            
-            # Analyze should not generate files (read-only)
-            reports_validation = self.cli_runner.check_report_generation(project_path)
-            # Note: analyze might still create reports, so we don't assert false here
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = partial_project
+        
+        # Run analyze command
+        exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
+            project_path,
+            timeout=30
+        )
+        
+        # Validate execution
+        assert exit_code != -1, f"Analyze command failed: {stderr}"
+        
+        # Validate output
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Analyze command should produce output"
+        
+        # Analyze should not generate files (read-only)
+        reports_validation = self.cli_runner.check_report_generation(project_path)
+        # Note: analyze might still create reports, so we don't assert false here
     
-    def test_generate_command(self):
+    def test_generate_command(self, empty_project):
         """Test generate command for test generation only"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run generate command
-            exit_code, stdout, stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Validate execution
-            assert exit_code != -1, f"Generate command failed: {stderr}"
-            
-            # Validate output
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Generate command should produce output"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run generate command
+        exit_code, stdout, stderr = self.cli_runner.run_generate_command(
+            project_path,
+            timeout=30
+        )
+        
+        # Validate execution
+        assert exit_code != -1, f"Generate command failed: {stderr}"
+        
+        # Validate output
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Generate command should produce output"
     
     def test_invalid_project_path(self):
         """Test CLI commands with invalid project paths"""
@@ -368,21 +704,19 @@ class TestCLIInterface:
         assert exit_code != 0, "Command should fail with invalid path"
         assert "Error" in stderr or "Usage" in stderr, "Should provide error message"
     
-    def test_command_timeout_handling(self):
+    def test_command_timeout_handling(self, empty_project):
         """Test that commands handle timeouts properly"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run with very short timeout to test timeout handling
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path,
-                timeout=1  # 1 second timeout
-            )
-            
-            # Should handle timeout gracefully
-            if exit_code == -1:
-                assert "timed out" in stderr.lower(), "Should indicate timeout"
+        project_path = empty_project
+        
+        # Run with very short timeout to test timeout handling
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path,
+            timeout=1  # 1 second timeout
+        )
+        
+        # Should handle timeout gracefully
+        if exit_code == -1:
+            assert "timed out" in stderr.lower(), "Should indicate timeout"
 
 
 class TestAuditCommandFunctionality:
@@ -391,224 +725,170 @@ class TestAuditCommandFunctionality:
     def setup_method(self):
         """Set up test environment"""
         self.cli_runner = CLITestRunner(timeout_seconds=120)  # Longer timeout for audit tests
-        self.temp_dir = None
-    
-    def teardown_method(self):
-        """Clean up test environment"""
-        if self.temp_dir and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
     
-    def test_audit_empty_project_comprehensive(self):
+    def test_audit_empty_project_comprehensive(self, empty_project):
         """Test audit command with empty project - comprehensive validation"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run audit command with verbose output
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--verbose", "--no-mutation"],  # Skip mutation for faster testing
-                timeout=60
-            )
-            
-            # Validate command execution
-            assert exit_code != -1, f"Command timed out or failed to execute: {stderr}"
-            
-            # Validate output format
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Command should produce output"
-            assert output_validation["no_python_errors"], f"Should not have Python errors: {stderr}"
-            
-            # Check for expected audit stages in output
-            expected_stages = [
-                "Mapping Codebase",
-                "Discovering",
-                "Assessing"
-            ]
-            
-            for stage in expected_stages:
-                assert stage in stdout or stage in stderr, f"Missing expected stage: {stage}"
-            
-            # Validate report generation
-            reports_validation = self.cli_runner.check_report_generation(project_path)
-            # Note: Reports might not be generated if audit fails, so we don't assert here
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run audit command with verbose output
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--verbose", "--no-mutation"],  # Skip mutation for faster testing
+            timeout=60
+        )
+        
+        # Validate command execution
+        assert exit_code != -1, f"Command timed out or failed to execute: {stderr}"
+        
+        # Validate output format
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Command should produce output"
+        assert output_validation.no_python_errors, f"Should not have Python errors: {stderr}"
+        
+        # Check for expected audit stages in output
+        expected_stages = [
+            "Mapping Codebase",
+            "Discovering",
+            "Assessing"
+        ]
+        
+        for stage in expected_stages:
+            assert stage in stdout or stage in stderr, f"Missing expected stage: {stage}"
+        
+        # Validate report generation
+        reports_validation = self.cli_runner.check_report_generation(project_path)
+        # Note: Reports might not be generated if audit fails, so we don't assert here
     
-    def test_audit_partial_project_comprehensive(self):
+    def test_audit_partial_project_comprehensive(self, partial_project):
         """Test audit command with project that has existing tests"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run audit command
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--verbose", "--no-mutation"],
-                timeout=60
-            )
-            
-            # Validate execution
-            assert exit_code != -1, f"Command failed: {stderr}"
-            
-            # Should detect existing tests
-            assert "test" in stdout.lower() or "test" in stderr.lower(), "Should mention tests"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = partial_project
+        
+        # Run audit command
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--verbose", "--no-mutation"],
+            timeout=60
+        )
+        
+        # Validate execution
+        assert exit_code != -1, f"Command failed: {stderr}"
+        
+        # Should detect existing tests
+        assert self.cli_runner.contains_any(("test",), stdout, stderr, ignore_case=True), "Should mention tests"
     
-    def test_audit_no_generate_flag(self):
+    def test_audit_no_generate_flag(self, empty_project):
         """Test audit command with --no-generate flag"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run audit with --no-generate
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--no-generate", "--verbose"],
-                timeout=30
-            )
-            
-            # Should complete without generating tests
-            assert exit_code != -1, f"Command failed: {stderr}"
-            
-            # Should not mention test generation
-            combined_output = (stdout + stderr).lower()
-            generation_keywords = ["generating", "generated", "creating tests"]
-            
-            # It's okay if some keywords appear, but there should be less generation activity
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Should have output"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run audit with --no-generate
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--no-generate", "--verbose"],
+            timeout=30
+        )
+        
+        # Should complete without generating tests
+        assert exit_code != -1, f"Command failed: {stderr}"
+        
+        # It's okay if generation keywords appear, but there should be less generation activity
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Should have output"
     
-    def test_audit_no_mutation_flag(self):
+    def test_audit_no_mutation_flag(self, partial_project):
         """Test audit command with --no-mutation flag"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run audit with --no-mutation
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--no-mutation", "--verbose"],
-                timeout=30
-            )
-            
-            # Should complete without mutation testing
-            assert exit_code != -1, f"Command failed: {stderr}"
-            
-            # Should not mention mutation testing
-            combined_output = (stdout + stderr).lower()
-            assert "mutation" not in combined_output, "Should not perform mutation testing"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = partial_project
+        
+        # Run audit with --no-mutation
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--no-mutation", "--verbose"],
+            timeout=30
+        )
+        
+        # Should complete without mutation testing
+        assert exit_code != -1, f"Command failed: {stderr}"
+        
+        # Should not mention mutation testing
+        assert not self.cli_runner.contains_any(("mutation",), stdout, stderr, ignore_case=True), \
+            "Should not perform mutation testing"
     
-    def test_audit_combined_flags(self):
+    @pytest.mark.parametrize("flags", [
+        ["--no-generate", "--no-mutation"],
+        ["--verbose", "--no-generate"],
+        ["--verbose", "--no-mutation"],
+        ["--verbose", "--no-generate", "--no-mutation"]
+    ])
+    def test_audit_combined_flags(self, empty_project, flags):
         """Test audit command with combined flags"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Test various flag combinations
-            flag_combinations = [
-                ["--no-generate", "--no-mutation"],
-                ["--verbose", "--no-generate"],
-                ["--verbose", "--no-mutation"],
-                ["--verbose", "--no-generate", "--no-mutation"]
-            ]
-            
-            for flags in flag_combinations:
-                exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                    project_path, 
-                    flags=flags,
-                    timeout=30
-                )
-                
-                # Should not crash with any flag combination
-                assert exit_code != -1, f"Command failed with flags {flags}: {stderr}"
-                
-                # Should have output
-                output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-                assert output_validation["has_output"], f"No output with flags {flags}"
-                
-                # Clean up between runs
-                self.cli_runner.cleanup_generated_files(project_path)
-    
-    def test_audit_iterations_flag(self):
+        project_path = empty_project
+        
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=flags,
+            timeout=30
+        )
+        
+        # Should not crash with any flag combination
+        assert exit_code != -1, f"Command failed with flags {flags}: {stderr}"
+        
+        # Should have output
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, f"No output with flags {flags}"
+    
+    @pytest.mark.parametrize("iterations", [1, 2])
+    def test_audit_iterations_flag(self, empty_project, iterations):
         """Test audit command with --iterations flag"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Test with different iteration counts
-            for iterations in [1, 2]:
-                exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                    project_path, 
-                    flags=["--iterations", str(iterations), "--no-mutation"],
-                    timeout=45
-                )
-                
-                # Should handle iterations parameter
-                assert exit_code != -1, f"Command failed with iterations={iterations}: {stderr}"
-                
-                # Clean up between runs
-                self.cli_runner.cleanup_generated_files(project_path)
-    
-    def test_audit_report_generation(self):
+        project_path = empty_project
+        
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--iterations", str(iterations), "--no-mutation"],
+            timeout=45
+        )
+        
+        # Should handle iterations parameter
+        assert exit_code != -1, f"Command failed with iterations={iterations}: {stderr}"
+    
+    def test_audit_report_generation(self, partial_project):
         """Test that audit command generates reports in reports/ directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Ensure reports directory doesn't exist initially
-            reports_dir = project_path / "reports"
-            if reports_dir.exists():
-                shutil.rmtree(reports_dir)
-            
-            # Run audit command
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--verbose", "--no-mutation"],
-                timeout=60
-            )
-            
-            # Command should complete
-            assert exit_code != -1, f"Command failed: {stderr}"
-            
-            # Check report generation
-            reports_validation = self.cli_runner.check_report_generation(project_path)
-            
-            # At minimum, reports directory should be created
-            assert reports_validation["reports_dir_exists"], "Reports directory should be created"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = partial_project
+        
+        # Ensure reports directory doesn't exist initially
+        reports_dir = project_path / "reports"
+        if reports_dir.exists():
+            shutil.rmtree(reports_dir)
+        
+        # Run audit command
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--verbose", "--no-mutation"],
+            timeout=60
+        )
+        
+        # Command should complete
+        assert exit_code != -1, f"Command failed: {stderr}"
+        
+        # Check report generation
+        reports_validation = self.cli_runner.check_report_generation(project_path)
+        
+        # At minimum, reports directory should be created
+        assert reports_validation.reports_dir_exists, "Reports directory should be created"
     
-    def test_audit_error_handling(self):
+    def test_audit_error_handling(self, broken_project):
         """Test audit command error handling with broken project"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_broken_project(temp_path)
-            
-            # Run audit on broken project
-            exit_code, stdout, stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--verbose"],
-                timeout=30
-            )
-            
-            # Should handle errors gracefully
-            # Command might fail, but should not crash completely
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Should provide some output even with errors"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = broken_project
+        
+        # Run audit on broken project
+        exit_code, stdout, stderr = self.cli_runner.run_audit_command(
+            project_path, 
+            flags=["--verbose"],
+            timeout=30
+        )
+        
+        # Should handle errors gracefully
+        # Command might fail, but should not crash completely
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Should provide some output even with errors"
 
 
 class TestAnalyzeAndGenerateCommands:
@@ -617,305 +897,190 @@ class TestAnalyzeAndGenerateCommands:
     def setup_method(self):
         """Set up test environment"""
         self.cli_runner = CLITestRunner(timeout_seconds=90)
-        self.temp_dir = None
-    
-    def teardown_method(self):
-        """Clean up test environment"""
-        if self.temp_dir and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
     
-    def test_analyze_command_empty_project(self):
+    def test_analyze_command_empty_project(self, empty_project):
         """Test analyze command with empty project (read-only analysis)"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run analyze command
-            exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=45
-            )
-            
-            # Validate execution - command should attempt to run
-            assert exit_code != -1, f"Analyze command timed out: {stderr}"
-            
-            # Validate that we get some output (even if there are display issues)
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Analyze command should produce output"
-            
-            # For Windows Unicode issues, we're more lenient about errors
-            # The key is that the command attempts to run and provides feedback
-            combined_output = stdout + stderr
-            
-            # Look for any indication that analysis was attempted
-            analysis_indicators = [
-                "Mapping", "Discovering", "Assessing", "Error", "Framework", 
-                "project", "analysis", "codebase", "test"
-            ]
-            
-            has_analysis_attempt = any(
-                indicator.lower() in combined_output.lower() 
-                for indicator in analysis_indicators
-            )
-            assert has_analysis_attempt, f"Should show analysis attempt. Output: {combined_output[:500]}"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run analyze command
+        exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
+            project_path,
+            timeout=45
+        )
+        
+        # Validate execution - command should attempt to run
+        assert exit_code != -1, f"Analyze command timed out: {stderr}"
+        
+        # Validate that we get some output (even if there are display issues)
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Analyze command should produce output"
+        
+        # For Windows Unicode issues, we're more lenient about errors
+        # The key is that the command attempts to run and provides feedback
+        # Look for any indication that analysis was attempted
+        has_analysis_attempt = self.cli_runner.contains_any(
+            _ANALYSIS_INDICATORS, stdout, stderr, ignore_case=True
+        )
+        assert has_analysis_attempt, f"Should show analysis attempt. Output: {self.cli_runner.output_excerpt(stdout, stderr)}"
     
-    def test_analyze_command_partial_project(self):
+    def test_analyze_command_partial_project(self, partial_project):
         """Test analyze command with project that has existing tests"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run analyze command
-            exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=45
-            )
-            
-            # Validate execution
-            assert exit_code != -1, f"Analyze command failed: {stderr}"
-            
-            # Should detect existing tests
-            combined_output = (stdout + stderr).lower()
-            assert "test" in combined_output, "Should detect existing tests"
-            
-            # Should show coverage information
-            coverage_keywords = ["coverage", "covered", "uncovered"]
-            has_coverage_info = any(keyword in combined_output for keyword in coverage_keywords)
-            assert has_coverage_info, "Should show coverage information"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = partial_project
+        
+        # Run analyze command
+        exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
+            project_path,
+            timeout=45
+        )
+        
+        # Validate execution
+        assert exit_code != -1, f"Analyze command failed: {stderr}"
+        
+        # Should detect existing tests
+        assert self.cli_runner.contains_any(("test",), stdout, stderr, ignore_case=True), \
+            "Should detect existing tests"
+        
+        # Should show coverage information
+        has_coverage_info = self.cli_runner.contains_any(_COVERAGE_KEYWORDS, stdout, stderr, ignore_case=True)
+        assert has_coverage_info, "Should show coverage information"
     
-    def test_analyze_command_output_format(self):
+    def test_analyze_command_output_format(self, partial_project):
         """Test that analyze command output matches expected CLI patterns"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run analyze command
-            exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Validate output format
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Should have output"
-            assert output_validation["has_progress_indicators"], "Should have progress indicators (emojis)"
-            
-            # Should have structured sections
-            expected_sections = ["Codebase", "Test", "Quality", "Metrics"]
-            combined_output = stdout + stderr
-            has_sections = any(section in combined_output for section in expected_sections)
-            assert has_sections, "Should have structured output sections"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
-    
-    def test_generate_command_empty_project(self):
-        """Test generate command with empty project (test generation only)"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run generate command
-            exit_code, stdout, stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=60
-            )
-            
-            # Validate execution - command should attempt to run
-            assert exit_code != -1, f"Generate command timed out: {stderr}"
-            
-            # Validate that we get some output
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Generate command should produce output"
-            
-            # Look for any indication that generation was attempted
-            combined_output = (stdout + stderr).lower()
-            generation_indicators = [
-                "generating", "generated", "uncovered", "units", "mapping", 
-                "discovering", "test", "framework", "error"
-            ]
-            
-            has_generation_attempt = any(
-                indicator in combined_output for indicator in generation_indicators
-            )
-            assert has_generation_attempt, f"Should show generation attempt. Output: {combined_output[:500]}"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
-    
-    def test_generate_command_partial_project(self):
-        """Test generate command with project that has existing tests"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run generate command
-            exit_code, stdout, stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=60
-            )
-            
-            # Validate execution
-            assert exit_code != -1, f"Generate command failed: {stderr}"
-            
+        project_path = partial_project
+        
+        # Run analyze command
+        exit_code, stdout, stderr = self.cli_runner.run_analyze_command(
+            project_path,
+            timeout=30
+        )
+        
+        # Validate output format
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Should have output"
+        assert output_validation.has_progress_indicators, "Should have progress indicators (emojis)"
+        
+        # Should have structured sections
+        has_sections = self.cli_runner.contains_any(_EXPECTED_SECTIONS, stdout, stderr)
+        assert has_sections, "Should have structured output sections"
+    
+    @pytest.mark.parametrize("project_fixture,has_existing_tests", [
+        ("empty_project", False),
+        ("partial_project", True)
+    ])
+    def test_generate_command_project(self, request, project_fixture, has_existing_tests):
+        """Test generate command with an empty project and one with existing tests"""
+        project_path = request.getfixturevalue(project_fixture)
+        
+        # Run generate command
+        exit_code, stdout, stderr = self.cli_runner.run_generate_command(
+            project_path,
+            timeout=60
+        )
+        
+        # Validate execution - command should attempt to run
+        assert exit_code != -1, f"Generate command timed out: {stderr}"
+        
+        # Validate that we get some output
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Generate command should produce output"
+        
+        # Look for any indication that generation was attempted
+        has_generation_attempt = self.cli_runner.contains_any(
+            _GEN_INDICATORS, stdout, stderr, ignore_case=True
+        )
+        assert has_generation_attempt, f"Should show generation attempt. Output: {self.cli_runner.output_excerpt(stdout, stderr).lower()}"
+        
+        if has_existing_tests:
             # Should identify uncovered units
-            combined_output = (stdout + stderr).lower()
-            assert "uncovered" in combined_output or "units" in combined_output, "Should identify uncovered units"
+            assert self.cli_runner.contains_any(("uncovered", "units"), stdout, stderr, ignore_case=True), \
+                "Should identify uncovered units"
             
             # Should attempt test generation
-            generation_keywords = ["generating", "generated", "creating"]
-            has_generation = any(keyword in combined_output for keyword in generation_keywords)
+            has_generation = self.cli_runner.contains_any(_GEN_KEYWORDS, stdout, stderr, ignore_case=True)
             assert has_generation, "Should attempt test generation"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
     
-    def test_generate_command_output_format(self):
+    def test_generate_command_output_format(self, empty_project):
         """Test that generate command output matches existing CLI patterns"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run generate command
-            exit_code, stdout, stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=45
-            )
-            
-            # Validate output format
-            output_validation = self.cli_runner.validate_output_format(stdout, stderr)
-            assert output_validation["has_output"], "Should have output"
-            assert output_validation["has_progress_indicators"], "Should have progress indicators"
-            
-            # Should show generation progress
-            combined_output = stdout + stderr
-            progress_indicators = ["Found", "Generating", "Generated", "✅", "❌"]
-            has_progress = any(indicator in combined_output for indicator in progress_indicators)
-            assert has_progress, "Should show generation progress"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run generate command
+        exit_code, stdout, stderr = self.cli_runner.run_generate_command(
+            project_path,
+            timeout=45
+        )
+        
+        # Validate output format
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, "Should have output"
+        assert output_validation.has_progress_indicators, "Should have progress indicators"
+        
+        # Should show generation progress
+        has_progress = self.cli_runner.contains_any(_PROGRESS_INDICATORS, stdout, stderr)
+        assert has_progress, "Should show generation progress"
     
-    def test_analyze_vs_generate_differences(self):
+    def test_analyze_vs_generate_differences(self, empty_project):
         """Test that analyze and generate commands have different behaviors"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_empty_project(temp_path)
-            
-            # Run analyze command
-            analyze_exit, analyze_stdout, analyze_stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Run generate command
-            generate_exit, generate_stdout, generate_stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=45
-            )
-            
-            # Both should execute
-            assert analyze_exit != -1, f"Analyze failed: {analyze_stderr}"
-            assert generate_exit != -1, f"Generate failed: {generate_stderr}"
-            
-            # Outputs should be different
-            analyze_output = (analyze_stdout + analyze_stderr).lower()
-            generate_output = (generate_stdout + generate_stderr).lower()
-            
-            # Generate should mention generation activities more
-            generation_count_analyze = sum(
-                analyze_output.count(word) for word in ["generating", "generated", "creating"]
-            )
-            generation_count_generate = sum(
-                generate_output.count(word) for word in ["generating", "generated", "creating"]
-            )
-            
-            # Generate command should have more generation-related output
-            assert generation_count_generate >= generation_count_analyze, \
-                "Generate command should have more generation-related output"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        project_path = empty_project
+        
+        # Run analyze and generate concurrently, each on its own copy so
+        # generated tests cannot leak into the analysis
+        (
+            (analyze_exit, analyze_stdout, analyze_stderr),
+            (generate_exit, generate_stdout, generate_stderr)
+        ) = self.cli_runner.run_batch([
+            {"cmd": "analyze", "project_path": project_path, "timeout": 30},
+            {"cmd": "generate", "project_path": self.cli_runner.clone_project(project_path, "generate"), "timeout": 45}
+        ])
+        
+        # Both should execute
+        assert analyze_exit != -1, f"Analyze failed: {analyze_stderr}"
+        assert generate_exit != -1, f"Generate failed: {generate_stderr}"
+        
+        # Generate should mention generation activities more
+        generation_count_analyze = self.cli_runner.count_matches(
+            _GEN_KEYWORDS, analyze_stdout, analyze_stderr, ignore_case=True
+        )
+        generation_count_generate = self.cli_runner.count_matches(
+            _GEN_KEYWORDS, generate_stdout, generate_stderr, ignore_case=True
+        )
+        
+        # Generate command should have more generation-related output
+        assert generation_count_generate >= generation_count_analyze, \
+            "Generate command should have more generation-related output"
     
-    def test_commands_with_broken_project(self):
+    @pytest.mark.parametrize("cmd", ["analyze", "generate"])
+    def test_commands_with_broken_project(self, broken_project, cmd):
         """Test analyze and generate commands with broken project"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_broken_project(temp_path)
-            
-            # Test analyze command with broken project
-            analyze_exit, analyze_stdout, analyze_stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Test generate command with broken project
-            generate_exit, generate_stdout, generate_stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=30
-            )
-            
-            # Commands should handle errors gracefully
-            analyze_validation = self.cli_runner.validate_output_format(analyze_stdout, analyze_stderr)
-            generate_validation = self.cli_runner.validate_output_format(generate_stdout, generate_stderr)
-            
-            assert analyze_validation["has_output"], "Analyze should provide output even with errors"
-            assert generate_validation["has_output"], "Generate should provide output even with errors"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
+        exit_code, stdout, stderr = self.cli_runner.run_cli_command(
+            cmd,
+            broken_project,
+            timeout=30
+        )
+        
+        # Commands should handle errors gracefully
+        output_validation = self.cli_runner.validate_output_format(stdout, stderr)
+        assert output_validation.has_output, f"{cmd} should provide output even with errors"
     
-    def test_command_consistency(self):
+    @pytest.mark.parametrize("cmd,flags,timeout", [
+        ("audit", ["--no-mutation"], 45),
+        ("analyze", [], 30),
+        ("generate", [], 45)
+    ])
+    def test_command_consistency(self, partial_project, cmd, flags, timeout):
         """Test that commands produce consistent output formats"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = self.cli_runner.fixture_manager.create_partial_project(temp_path)
-            
-            # Run all three commands
-            audit_exit, audit_stdout, audit_stderr = self.cli_runner.run_audit_command(
-                project_path, 
-                flags=["--no-mutation"],
-                timeout=45
-            )
-            
-            analyze_exit, analyze_stdout, analyze_stderr = self.cli_runner.run_analyze_command(
-                project_path,
-                timeout=30
-            )
-            
-            generate_exit, generate_stdout, generate_stderr = self.cli_runner.run_generate_command(
-                project_path,
-                timeout=45
-            )
-            
-            # All commands should execute
-            commands = [
-                ("audit", audit_exit, audit_stderr),
-                ("analyze", analyze_exit, analyze_stderr),
-                ("generate", generate_exit, generate_stderr)
-            ]
-            
-            for cmd_name, exit_code, stderr in commands:
-                assert exit_code != -1, f"{cmd_name} command failed: {stderr}"
-            
-            # All should have consistent emoji usage
-            outputs = [audit_stdout + audit_stderr, analyze_stdout + analyze_stderr, generate_stdout + generate_stderr]
-            emoji_patterns = ["📊", "🔍", "📈"]
-            
-            for i, output in enumerate(outputs):
-                cmd_name = ["audit", "analyze", "generate"][i]
-                has_emojis = any(emoji in output for emoji in emoji_patterns)
-                assert has_emojis, f"{cmd_name} command should use consistent emoji patterns"
-            
-            # Clean up
-            self.cli_runner.cleanup_generated_files(project_path)
-
+        exit_code, stdout, stderr = self.cli_runner.run_cli_command(
+            cmd,
+            partial_project,
+            flags=flags,
+            timeout=timeout
+        )
+        
+        # Command should execute
+        assert exit_code != -1, f"{cmd} command failed: {stderr}"
+        
+        # Should have consistent emoji usage
+        has_emojis = self.cli_runner.contains_any(_EMOJI_PATTERNS, stdout, stderr)
+        assert has_emojis, f"{cmd} command should use consistent emoji patterns"
 
 if __name__ == "__main__":
     # Run tests directly
@@ -10,46 +10,154 @@ This module tests the framework's ability to:
 Requirements tested: 5.1, 5.3, 5.4
 """
 
-import tempfile
+import ast
+import functools
 import pytest
-import sys
 import subprocess
 import os
+import stat
+from collections import Counter
 from pathlib import Path
+from typing import Iterator, Union
 from unittest.mock import patch, MagicMock
 
-# Add src and fixtures to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "fixtures"))
-
+# src and tests/fixtures are put on sys.path by the pytest pythonpath setting
 from fixture_manager import FixtureManager
-from mock_llm_provider import MockLLMConfig, configure_mock_environment, restore_environment
+from mock_llm_provider import apply_mock_environment
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cached(content: bytes):
+    """Parse source bytes once, returning the module or the SyntaxError raised"""
+    try:
+        return ast.parse(content)
+    except SyntaxError as e:
+        return e
+
+
+def _parse_source(file_path: Union[str, Path]) -> ast.Module:
+    """Parse a source file, reusing the result for content already parsed
+    
+    Every test gets a fresh copy of the same fixture project, so keying on
+    content lets identical files share one parse across the session. The
+    returned tree is shared and must not be modified.
+    
+    Raises:
+        SyntaxError: If the file does not parse
+    """
+    # ast.parse decodes bytes itself, honouring any coding declaration
+    with open(file_path, "rb") as f:
+        result = _parse_cached(f.read())
+    if isinstance(result, SyntaxError):
+        raise result.with_traceback(None)
+    return result
+
+
+def _iter_source_files(directory: Path) -> Iterator[str]:
+    """Yield the paths of the Python files directly inside a directory
+    
+    Uses os.scandir, which reads file types from the directory listing and
+    avoids building a Path for every entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
+
+
+# LLM providers and the environment variable holding each one's API key
+_PROVIDER_ENV_VARS = (
+    ("OpenAI", "OPENAI_API_KEY"),
+    ("Azure OpenAI", "AZURE_API_KEY"),
+    ("Anthropic", "ANTHROPIC_API_KEY"),
+    ("Google", "GOOGLE_API_KEY"),
+    ("Cohere", "COHERE_API_KEY")
+)
+
+# Modules imported by the fixture sources that are never installed
+_MISSING_MODULES = frozenset({"nonexistent_module", "another_missing_module", "missing_package"})
+
+# Recommendations reported when source files import missing dependencies
+_DEPENDENCY_RECOMMENDATIONS = (
+    "Missing dependencies detected in source files",
+    "Check requirements.txt or pyproject.toml for missing packages",
+    "Install missing dependencies before running analysis",
+    "Consider using virtual environment for dependency management"
+)
+
+# Setup instructions shown when no LLM provider credentials are configured
+_SETUP_INSTRUCTIONS = (
+    "No LLM provider credentials found in environment variables",
+    "Please set up at least one of the following:",
+    "  - OPENAI_API_KEY for OpenAI GPT models",
+    "  - AZURE_API_KEY and AZURE_OPENAI_ENDPOINT for Azure OpenAI",
+    "  - ANTHROPIC_API_KEY for Claude models",
+    "Create a .env file in your project root with your API keys",
+    "Example .env file:",
+    "  OPENAI_API_KEY=your-openai-key-here",
+    "  AZURE_API_KEY=your-azure-key-here"
+)
+
+# Recommendations reported when tests are generated for broken source files
+_DEGRADATION_RECOMMENDATIONS = (
+    "Fix syntax errors in source files before re-running analysis",
+    "Generated tests may have limited coverage due to source code issues",
+    "Consider manual review of generated tests for problematic files",
+    "Re-run analysis after fixing source code issues"
+)
+
+# Source files added to an empty project for each non-syntax error type
+_ERROR_SOURCES = {
+    "import": ("import_errors.py", '''
+import nonexistent_module
+from missing_package import missing_function
+
+def function_with_imports():
+    return nonexistent_module.function()
+'''),
+    "runtime": ("runtime_errors.py", '''
+def divide_by_zero():
+    return 1 / 0
+
+def access_undefined():
+    return undefined_variable
+
+def type_error():
+    return "string" + 42
+''')
+}
+
+
+@pytest.fixture(scope="session", params=["syntax", "import", "runtime"])
+def error_project(request, tmp_path_factory):
+    """Project containing one type of error, built once per error type
+    
+    The project is shared by every test using the same error type, so it must
+    be treated as read-only.
+    
+    Returns:
+        Tuple of (error_type, project_path)
+    """
+    error_type = request.param
+    
+    if error_type == "syntax":
+        # The cached broken project template already has the syntax errors
+        _, project_path = request.getfixturevalue("broken_project_template")
+    else:
+        project_path = FixtureManager().create_empty_project(tmp_path_factory.mktemp(f"err-{error_type}"))
+        file_name, source = _ERROR_SOURCES[error_type]
+        (project_path / "src" / file_name).write_text(source)
+    
+    return error_type, project_path
 
 
 class TestErrorScenarioHandling:
     """Test framework behavior with broken codebases and error conditions"""
     
     @pytest.fixture(autouse=True)
-    def setup_mock_environment(self):
+    def setup_mock_environment(self, monkeypatch):
         """Set up mock environment for all tests"""
-        self.original_env = configure_mock_environment()
-        self.mock_config = MockLLMConfig()
-        yield
-        restore_environment(self.original_env)
-    
-    @pytest.fixture
-    def fixture_manager(self):
-        """Provide fixture manager for test projects"""
-        return FixtureManager()
-    
-    @pytest.fixture
-    def broken_project(self, fixture_manager):
-        """Create a broken project fixture for testing"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = fixture_manager.create_broken_project(temp_path)
-            yield project_path
-            # Cleanup is automatic with TemporaryDirectory
+        apply_mock_environment(monkeypatch)
     
     def test_broken_project_structure_validation(self, broken_project):
         """Test that broken project fixture has expected structure with syntax errors"""
@@ -60,13 +168,13 @@ class TestErrorScenarioHandling:
         
         # Verify the broken file contains syntax errors
         broken_file = broken_project / "src" / "broken_syntax.py"
-        content = broken_file.read_text()
+        content = broken_file.read_bytes()
         
         # Check for known syntax issues
-        assert "def __init__(self" in content  # Missing closing parenthesis
-        assert "def divide(self, a, b)" in content  # Missing colon
-        assert "undefined_variable" in content  # Undefined variable
-        assert "if True" in content and "if True:" not in content  # Missing colon
+        assert b"def __init__(self" in content  # Missing closing parenthesis
+        assert b"def divide(self, a, b)" in content  # Missing colon
+        assert b"undefined_variable" in content  # Undefined variable
+        assert b"if True" in content and b"if True:" not in content  # Missing colon
     
     def test_syntax_error_detection_and_handling(self, broken_project):
         """Test framework's ability to detect and handle Python syntax errors"""
@@ -80,9 +188,7 @@ class TestErrorScenarioHandling:
         
         try:
             # Attempt to parse the broken file (simulate AST parsing)
-            import ast
-            content = broken_file.read_text()
-            ast.parse(content)
+            _parse_source(broken_file)
             processed_files.append(str(broken_file))
         except SyntaxError as e:
             # Framework should catch syntax errors and continue
@@ -114,9 +220,7 @@ class ValidClass:
         
         # Test that framework can process valid files despite broken ones
         try:
-            import ast
-            content = valid_file.read_text()
-            ast.parse(content)
+            _parse_source(valid_file)
             processed_files.append(str(valid_file))
         except SyntaxError as e:
             parsing_errors.append({
@@ -161,17 +265,21 @@ def function_with_missing_deps():
         
         try:
             # Simulate import checking (not actual import to avoid errors)
-            content = missing_import_file.read_text()
+            tree = _parse_source(missing_import_file)
             
-            # Check for import statements
-            import_lines = [line.strip() for line in content.split('\n') 
-                          if line.strip().startswith(('import ', 'from '))]
-            
-            for line in import_lines:
-                if 'nonexistent_module' in line or 'missing_module' in line:
+            # Check the modules named by each import statement
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    modules = [alias.name for alias in node.names]
+                elif isinstance(node, ast.ImportFrom):
+                    modules = [node.module]
+                else:
+                    continue
+                
+                if not _MISSING_MODULES.isdisjoint(modules):
                     import_errors.append({
                         "file": str(missing_import_file),
-                        "import_line": line,
+                        "import_line": ast.unparse(node),
                         "error_type": "ModuleNotFoundError"
                     })
         
@@ -187,22 +295,14 @@ def function_with_missing_deps():
         assert any("nonexistent_module" in error.get("import_line", "") for error in import_errors)
         
         # Simulate framework's error handling recommendations
-        error_recommendations = []
-        
-        if import_errors:
-            error_recommendations.extend([
-                "Missing dependencies detected in source files",
-                "Check requirements.txt or pyproject.toml for missing packages",
-                "Install missing dependencies before running analysis",
-                "Consider using virtual environment for dependency management"
-            ])
+        error_recommendations = _DEPENDENCY_RECOMMENDATIONS if import_errors else ()
         
         # Verify meaningful error recommendations
         assert len(error_recommendations) > 0
         assert "Missing dependencies detected" in error_recommendations[0]
         assert "requirements.txt" in error_recommendations[1]
     
-    def test_invalid_project_path_handling(self, fixture_manager):
+    def test_invalid_project_path_handling(self, tmp_path):
         """Test framework behavior with invalid project paths"""
         # Requirement 5.1: System SHALL display clear error messages and exit gracefully
         
@@ -212,7 +312,9 @@ def function_with_missing_deps():
         # Simulate framework path validation
         path_errors = []
         
-        if not nonexistent_path.exists():
+        try:
+            os.stat(nonexistent_path)
+        except FileNotFoundError:
             path_errors.append({
                 "path": str(nonexistent_path),
                 "error": "Project path does not exist",
@@ -220,34 +322,31 @@ def function_with_missing_deps():
             })
         
         # Test with file instead of directory
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as temp_file:
-            file_path = Path(temp_file.name)
-            
-            if file_path.is_file() and not file_path.is_dir():
-                path_errors.append({
-                    "path": str(file_path),
-                    "error": "Path is a file, not a directory",
-                    "error_type": "InvalidPathError"
-                })
+        file_path = tmp_path / "module.py"
+        file_path.touch()
         
-        # Cleanup outside the context manager to avoid permission issues
-        try:
-            file_path.unlink()
-        except (PermissionError, FileNotFoundError):
-            # Ignore cleanup errors on Windows
-            pass
+        # A single stat answers both is_file() and not is_dir()
+        if stat.S_ISREG(os.stat(file_path).st_mode):
+            path_errors.append({
+                "path": str(file_path),
+                "error": "Path is a file, not a directory",
+                "error_type": "InvalidPathError"
+            })
         
         # Test with empty directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            empty_path = Path(temp_dir)
-            
-            # Check if directory has required structure
-            if not (empty_path / "src").exists() and not (empty_path / "pyproject.toml").exists():
-                path_errors.append({
-                    "path": str(empty_path),
-                    "error": "Directory does not contain a valid Python project",
-                    "error_type": "InvalidProjectError"
-                })
+        empty_path = tmp_path / "empty"
+        empty_path.mkdir()
+        
+        # Check if directory has required structure, probing both markers with one listing
+        with os.scandir(empty_path) as entries:
+            has_project_markers = any(entry.name in ("src", "pyproject.toml") for entry in entries)
+        
+        if not has_project_markers:
+            path_errors.append({
+                "path": str(empty_path),
+                "error": "Directory does not contain a valid Python project",
+                "error_type": "InvalidProjectError"
+            })
         
         # Verify error detection
         assert len(path_errors) >= 2
@@ -269,81 +368,45 @@ def function_with_missing_deps():
         assert all("Error:" in msg for msg in error_messages)
         assert any("does not exist" in msg for msg in error_messages)
     
-    def test_llm_provider_error_handling(self, broken_project):
+    def test_llm_provider_error_handling(self, broken_project, monkeypatch):
         """Test framework behavior when LLM provider fails or is misconfigured"""
         # Requirement 5.2: System SHALL detect missing/invalid credentials and provide setup instructions
         
-        # Simulate missing API key scenario
-        original_openai_key = os.environ.get("OPENAI_API_KEY")
-        original_azure_key = os.environ.get("AZURE_API_KEY")
-        original_anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+        # Remove all API keys to simulate missing credentials
+        for _, env_var in _PROVIDER_ENV_VARS:
+            monkeypatch.delenv(env_var, raising=False)
+        
+        # Simulate LLM provider detection
+        provider_errors = []
+        available_providers = []
+        
+        # Check for available providers (simulate framework logic)
+        for provider, env_var in _PROVIDER_ENV_VARS:
+            if os.environ.get(env_var):
+                available_providers.append(provider)
+            else:
+                provider_errors.append({
+                    "provider": provider,
+                    "error": "API key not found in environment variables"
+                })
         
-        try:
-            # Remove all API keys to simulate missing credentials
-            for key in ["OPENAI_API_KEY", "AZURE_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "COHERE_API_KEY"]:
-                if key in os.environ:
-                    del os.environ[key]
-            
-            # Simulate LLM provider detection
-            provider_errors = []
-            available_providers = []
-            
-            # Check for available providers (simulate framework logic)
-            provider_checks = {
-                "OpenAI": os.environ.get("OPENAI_API_KEY"),
-                "Azure OpenAI": os.environ.get("AZURE_API_KEY"),
-                "Anthropic": os.environ.get("ANTHROPIC_API_KEY"),
-                "Google": os.environ.get("GOOGLE_API_KEY"),
-                "Cohere": os.environ.get("COHERE_API_KEY")
-            }
-            
-            for provider, api_key in provider_checks.items():
-                if api_key:
-                    available_providers.append(provider)
-                else:
-                    provider_errors.append({
-                        "provider": provider,
-                        "error": "API key not found in environment variables"
-                    })
-            
-            # Verify no providers are available
-            assert len(available_providers) == 0
-            assert len(provider_errors) >= 3  # At least OpenAI, Azure, Anthropic
-            
-            # Simulate setup instructions generation
-            setup_instructions = [
-                "No LLM provider credentials found in environment variables",
-                "Please set up at least one of the following:",
-                "  - OPENAI_API_KEY for OpenAI GPT models",
-                "  - AZURE_API_KEY and AZURE_OPENAI_ENDPOINT for Azure OpenAI",
-                "  - ANTHROPIC_API_KEY for Claude models",
-                "Create a .env file in your project root with your API keys",
-                "Example .env file:",
-                "  OPENAI_API_KEY=your-openai-key-here",
-                "  AZURE_API_KEY=your-azure-key-here"
-            ]
-            
-            # Verify setup instructions are comprehensive
-            assert len(setup_instructions) >= 5
-            assert "No LLM provider credentials found" in setup_instructions[0]
-            assert "OPENAI_API_KEY" in setup_instructions[2]
-            assert ".env file" in setup_instructions[5]  # Corrected index
-            
-        finally:
-            # Restore original environment
-            if original_openai_key:
-                os.environ["OPENAI_API_KEY"] = original_openai_key
-            if original_azure_key:
-                os.environ["AZURE_API_KEY"] = original_azure_key
-            if original_anthropic_key:
-                os.environ["ANTHROPIC_API_KEY"] = original_anthropic_key
+        # Verify no providers are available
+        assert len(available_providers) == 0
+        assert len(provider_errors) >= 3  # At least OpenAI, Azure, Anthropic
+        
+        # Simulate setup instructions generation
+        setup_instructions = _SETUP_INSTRUCTIONS
+        
+        # Verify setup instructions are comprehensive
+        assert len(setup_instructions) >= 5
+        assert "No LLM provider credentials found" in setup_instructions[0]
+        assert "OPENAI_API_KEY" in setup_instructions[2]
+        assert ".env file" in setup_instructions[5]  # Corrected index
     
-    def test_network_timeout_and_retry_logic(self, broken_project):
+    def test_network_timeout_and_retry_logic(self, broken_project, mock_provider):
         """Test framework behavior with network timeouts and API failures"""
         # Requirement 5.5: System SHALL implement retry logic and provide meaningful error messages
         
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         # Simulate network timeout scenarios
         network_errors = []
         retry_attempts = []
@@ -387,16 +450,12 @@ def function_with_missing_deps():
         assert retry_attempts[2]["status"] == "success"
         
         # Test exponential backoff simulation
-        backoff_delays = []
         base_delay = 1.0
-        
-        for attempt in range(max_retries):
-            delay = base_delay * (2 ** attempt)  # Exponential backoff
-            backoff_delays.append(delay)
+        backoff_delays = [base_delay * (1 << attempt) for attempt in range(max_retries)]  # Exponential backoff
         
         # Verify exponential backoff pattern
         assert backoff_delays == [1.0, 2.0, 4.0]
-        assert all(backoff_delays[i] < backoff_delays[i+1] for i in range(len(backoff_delays)-1))
+        assert all(shorter < longer for shorter, longer in zip(backoff_delays, backoff_delays[1:]))
     
     def test_partial_failure_recovery(self, broken_project):
         """Test framework's ability to recover from partial failures"""
@@ -417,67 +476,39 @@ class Calculator:
         return a * b
 ''')
         
-        # Process files and track results
-        processing_results = []
-        failed_files = []
-        successful_files = []
+        # Process files and track results; per-file details are only built
+        # for what the assertions and the failure report actually use
+        successful_files = []  # (file, parsed tree)
+        failed_files = []      # (file, status, error)
         
-        source_files = list((broken_project / "src").glob("*.py"))
+        source_files = list(_iter_source_files(broken_project / "src"))
         
         for file_path in source_files:
             try:
                 # Simulate file processing
-                import ast
-                content = file_path.read_text()
-                
-                # Try to parse the file
-                parsed = ast.parse(content)
-                
-                # Simulate successful processing
-                processing_results.append({
-                    "file": str(file_path),
-                    "status": "success",
-                    "functions": len([node for node in ast.walk(parsed) if isinstance(node, ast.FunctionDef)]),
-                    "classes": len([node for node in ast.walk(parsed) if isinstance(node, ast.ClassDef)])
-                })
-                successful_files.append(file_path)
+                successful_files.append((file_path, _parse_source(file_path)))
                 
             except SyntaxError as e:
                 # Handle syntax errors gracefully
-                processing_results.append({
-                    "file": str(file_path),
-                    "status": "syntax_error",
-                    "error": str(e),
-                    "line": getattr(e, 'lineno', None)
-                })
-                failed_files.append(file_path)
+                failed_files.append((file_path, "syntax_error", e))
                 
             except Exception as e:
                 # Handle other errors
-                processing_results.append({
-                    "file": str(file_path),
-                    "status": "error",
-                    "error": str(e)
-                })
-                failed_files.append(file_path)
+                failed_files.append((file_path, "error", e))
         
         # Verify partial processing worked
-        assert len(processing_results) >= 2
+        assert len(successful_files) + len(failed_files) >= 2
         assert len(successful_files) >= 1  # At least the valid file
         assert len(failed_files) >= 1     # At least the broken file
         
-        # Verify specific results
-        success_results = [r for r in processing_results if r["status"] == "success"]
-        error_results = [r for r in processing_results if r["status"] in ["syntax_error", "error"]]
-        
-        assert len(success_results) >= 1
-        assert len(error_results) >= 1
-        
         # Verify successful file was processed correctly
-        valid_result = next((r for r in success_results if "valid_calculator" in r["file"]), None)
-        assert valid_result is not None
-        assert valid_result["functions"] >= 2  # add and multiply methods
-        assert valid_result["classes"] >= 1   # Calculator class
+        valid_tree = next((tree for file_path, tree in successful_files if "valid_calculator" in file_path), None)
+        assert valid_tree is not None
+        
+        # Count node types in a single walk of the tree
+        node_counts = Counter(map(type, ast.walk(valid_tree)))
+        assert node_counts[ast.FunctionDef] >= 2  # add and multiply methods
+        assert node_counts[ast.ClassDef] >= 1   # Calculator class
         
         # Generate failure report
         failure_report = {
@@ -487,11 +518,11 @@ class Calculator:
             "success_rate": len(successful_files) / len(source_files) * 100,
             "failed_file_details": [
                 {
-                    "file": result["file"],
-                    "error": result.get("error", "Unknown error"),
-                    "status": result["status"]
+                    "file": file_path,
+                    "error": str(error),
+                    "status": status
                 }
-                for result in error_results
+                for file_path, status, error in failed_files
             ]
         }
         
@@ -502,12 +533,10 @@ class Calculator:
         assert 0 < failure_report["success_rate"] < 100  # Partial success
         assert len(failure_report["failed_file_details"]) >= 1
     
-    def test_graceful_degradation_with_quality_thresholds(self, broken_project):
+    def test_graceful_degradation_with_quality_thresholds(self, broken_project, mock_provider):
         """Test framework's graceful degradation when quality thresholds cannot be met"""
         # Requirement 5.4: System SHALL continue processing and provide meaningful feedback
         
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         # Simulate test generation for broken code
         broken_file = broken_project / "src" / "broken_syntax.py"
         
@@ -570,12 +599,7 @@ class Calculator:
             "normal_quality_files": 0,
             "degraded_quality_files": 1 if generation_attempts else 0,
             "failed_files": len([a for a in generation_attempts if a["status"] == "failed"]),
-            "recommendations": [
-                "Fix syntax errors in source files before re-running analysis",
-                "Generated tests may have limited coverage due to source code issues",
-                "Consider manual review of generated tests for problematic files",
-                "Re-run analysis after fixing source code issues"
-            ]
+            "recommendations": _DEGRADATION_RECOMMENDATIONS
         }
         
         # Verify degradation handling
@@ -584,132 +608,87 @@ class Calculator:
         assert len(degradation_report["recommendations"]) >= 3
         assert "Fix syntax errors" in degradation_report["recommendations"][0]
     
-    def test_cli_error_handling(self, broken_project):
+    @pytest.mark.parametrize("command_type", ["audit", "analyze", "generate"])
+    def test_cli_error_handling(self, broken_project, command_type):
         """Test CLI interface error handling with broken projects"""
         # Test CLI behavior with broken project
         
         # Simulate CLI command construction
         project_path = str(broken_project)
-        cli_commands = [
-            ["python", "-m", "src", "audit", project_path],
-            ["python", "-m", "src", "analyze", project_path],
-            ["python", "-m", "src", "generate", project_path]
-        ]
-        
-        # Simulate CLI error handling
-        cli_results = []
-        
-        for command in cli_commands:
-            # Simulate command execution (without actually running)
-            command_type = command[3]  # audit, analyze, or generate
-            
-            # Simulate expected error handling behavior
-            expected_behavior = {
-                "command": " ".join(command),
-                "expected_exit_code": 1,  # Non-zero for errors
-                "expected_stderr_contains": [
-                    "Syntax errors detected",
-                    "Unable to parse source files",
-                    "Check Python syntax"
-                ],
-                "expected_stdout_contains": [
-                    f"Analyzing project at {project_path}",
-                    "Processing source files",
-                    "Errors encountered during processing"
-                ],
-                "graceful_failure": True
-            }
-            
-            cli_results.append(expected_behavior)
+        command = ["python", "-m", "src", command_type, project_path]
+        
+        # Simulate expected error handling behavior (without actually running)
+        result = {
+            "command": " ".join(command),
+            "expected_exit_code": 1,  # Non-zero for errors
+            "expected_stderr_contains": [
+                "Syntax errors detected",
+                "Unable to parse source files",
+                "Check Python syntax"
+            ],
+            "expected_stdout_contains": [
+                f"Analyzing project at {project_path}",
+                "Processing source files",
+                "Errors encountered during processing"
+            ],
+            "graceful_failure": True
+        }
         
         # Verify CLI error handling expectations
-        assert len(cli_results) == 3
-        
-        for result in cli_results:
-            assert result["expected_exit_code"] != 0  # Should indicate error
-            assert result["graceful_failure"] is True
-            assert len(result["expected_stderr_contains"]) >= 2
-            assert len(result["expected_stdout_contains"]) >= 2
-            assert "Syntax errors" in result["expected_stderr_contains"][0]
+        assert result["expected_exit_code"] != 0  # Should indicate error
+        assert result["graceful_failure"] is True
+        assert len(result["expected_stderr_contains"]) >= 2
+        assert len(result["expected_stdout_contains"]) >= 2
+        assert "Syntax errors" in result["expected_stderr_contains"][0]
     
-    @pytest.mark.parametrize("error_type", ["syntax", "import", "runtime"])
-    def test_different_error_types(self, fixture_manager, error_type):
+    def test_different_error_types(self, error_project):
         """Test framework handling of different types of errors"""
+        error_type, project_path = error_project
+        
+        if error_type == "syntax":
+            expected_errors = ["SyntaxError", "missing parenthesis", "missing colon"]
+        elif error_type == "import":
+            expected_errors = ["ModuleNotFoundError", "ImportError", "nonexistent_module"]
+        elif error_type == "runtime":
+            expected_errors = ["ZeroDivisionError", "NameError", "TypeError"]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Simulate error detection for each type
+        detected_errors = []
+        
+        for file_path in _iter_source_files(project_path / "src"):
+            with open(file_path, "rb") as f:
+                content = f.read()
             
+            # Check for different error patterns
             if error_type == "syntax":
-                # Use existing broken project
-                project_path = fixture_manager.create_broken_project(temp_path)
-                expected_errors = ["SyntaxError", "missing parenthesis", "missing colon"]
-                
+                if b"def __init__(self" in content and b"def __init__(self):" not in content:
+                    detected_errors.append("SyntaxError: missing parenthesis")
+                if b"def divide(self, a, b)" in content and b"def divide(self, a, b):" not in content:
+                    detected_errors.append("SyntaxError: missing colon")
+                    
             elif error_type == "import":
-                # Create project with import errors
-                project_path = fixture_manager.create_empty_project(temp_path)
-                import_error_file = project_path / "src" / "import_errors.py"
-                import_error_file.write_text('''
-import nonexistent_module
-from missing_package import missing_function
-
-def function_with_imports():
-    return nonexistent_module.function()
-''')
-                expected_errors = ["ModuleNotFoundError", "ImportError", "nonexistent_module"]
-                
+                if b"import nonexistent_module" in content:
+                    detected_errors.append("ModuleNotFoundError: nonexistent_module")
+                if b"from missing_package" in content:
+                    detected_errors.append("ImportError: missing_package")
+                    
             elif error_type == "runtime":
-                # Create project with runtime errors
-                project_path = fixture_manager.create_empty_project(temp_path)
-                runtime_error_file = project_path / "src" / "runtime_errors.py"
-                runtime_error_file.write_text('''
-def divide_by_zero():
-    return 1 / 0
-
-def access_undefined():
-    return undefined_variable
-
-def type_error():
-    return "string" + 42
-''')
-                expected_errors = ["ZeroDivisionError", "NameError", "TypeError"]
-            
-            # Simulate error detection for each type
-            detected_errors = []
-            
-            source_files = list((project_path / "src").glob("*.py"))
-            for file_path in source_files:
-                content = file_path.read_text()
-                
-                # Check for different error patterns
-                if error_type == "syntax":
-                    if "def __init__(self" in content and "def __init__(self):" not in content:
-                        detected_errors.append("SyntaxError: missing parenthesis")
-                    if "def divide(self, a, b)" in content and "def divide(self, a, b):" not in content:
-                        detected_errors.append("SyntaxError: missing colon")
-                        
-                elif error_type == "import":
-                    if "import nonexistent_module" in content:
-                        detected_errors.append("ModuleNotFoundError: nonexistent_module")
-                    if "from missing_package" in content:
-                        detected_errors.append("ImportError: missing_package")
-                        
-                elif error_type == "runtime":
-                    if "1 / 0" in content:
-                        detected_errors.append("ZeroDivisionError: division by zero")
-                    if "undefined_variable" in content:
-                        detected_errors.append("NameError: undefined_variable")
-                    if '"string" + 42' in content:
-                        detected_errors.append("TypeError: string + int")
-            
-            # Verify appropriate errors were detected
-            assert len(detected_errors) >= 1
-            
-            # Check that expected error types are present
-            error_text = " ".join(detected_errors)
-            for expected_error in expected_errors:
-                if expected_error in ["SyntaxError", "ModuleNotFoundError", "ImportError", 
-                                    "ZeroDivisionError", "NameError", "TypeError"]:
-                    assert expected_error in error_text
-                else:
-                    # Check for specific error content
-                    assert expected_error in error_text or any(expected_error in err for err in detected_errors)
\ No newline at end of file
+                if b"1 / 0" in content:
+                    detected_errors.append("ZeroDivisionError: division by zero")
+                if b"undefined_variable" in content:
+                    detected_errors.append("NameError: undefined_variable")
+                if b'"string" + 42' in content:
+                    detected_errors.append("TypeError: string + int")
+        
+        # Verify appropriate errors were detected
+        assert len(detected_errors) >= 1
+        
+        # Check that expected error types are present
+        error_text = " ".join(detected_errors)
+        for expected_error in expected_errors:
+            if expected_error in ["SyntaxError", "ModuleNotFoundError", "ImportError", 
+                                "ZeroDivisionError", "NameError", "TypeError"]:
+                assert expected_error in error_text
+            else:
+                # Check for specific error content
+                assert expected_error in error_text or any(expected_error in err for err in detected_errors)
\ No newline at end of file
@@ -10,91 +10,141 @@ This module tests the framework's ability to:
 Requirements tested: 4.1, 4.2, 4.3
 """
 
-import tempfile
+import ast
+import functools
+import os
 import pytest
-import sys
 from pathlib import Path
+from typing import Dict, Tuple
 from unittest.mock import patch, MagicMock
 
-# Add src and fixtures to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "fixtures"))
+# src and tests/fixtures are put on sys.path by the pytest pythonpath setting
+from mock_llm_provider import apply_mock_environment
 
-from fixture_manager import FixtureManager
-from mock_llm_provider import MockLLMConfig, configure_mock_environment, restore_environment
+
+@functools.lru_cache(maxsize=None)
+def _analyze_source(source: str) -> Dict[str, Tuple[str, ...]]:
+    """Collect the test structure of Python source in a single AST walk
+    
+    Unlike line matching, this ignores text inside strings and docstrings.
+    Results are cached on the source text, so every test inspecting the same
+    file shares one parse.
+    
+    Returns:
+        Dictionary with "test_methods", "test_classes", "functions" (public
+        function and method names), "assertions" and "imports" (statement source)
+    """
+    analysis = {"test_methods": [], "test_classes": [], "functions": [], "assertions": [], "imports": []}
+    
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name.startswith("test_"):
+                analysis["test_methods"].append(node.name)
+            if not node.name.startswith("_"):
+                analysis["functions"].append(node.name)
+        elif isinstance(node, ast.ClassDef):
+            if node.name.startswith("Test"):
+                analysis["test_classes"].append(node.name)
+        elif isinstance(node, ast.Assert):
+            analysis["assertions"].append(ast.unparse(node))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            analysis["imports"].append(ast.unparse(node))
+    
+    return {key: tuple(values) for key, values in analysis.items()}
+
+
+@pytest.fixture(scope="session")
+def shared_partial_project(partial_project_template) -> Path:
+    """The cached partial project template itself, for tests that only read it
+    
+    Tests that write into the project must use the per-test partial_project
+    copy instead.
+    """
+    _, project_path = partial_project_template
+    return project_path
+
+
+@pytest.fixture(scope="session")
+def project_sources(shared_partial_project):
+    """Contents of the partial project's source and test files, read once per session
+    
+    Read from the cached template, which every partial_project copy matches
+    until a test modifies it.
+    
+    Returns:
+        Dictionary mapping file stem to file content
+    """
+    project_path = shared_partial_project
+    return {
+        "test_calculator": (project_path / "tests" / "test_calculator.py").read_text(encoding="utf-8"),
+        "calculator": (project_path / "src" / "calculator.py").read_text(encoding="utf-8"),
+        "utils": (project_path / "src" / "utils.py").read_text(encoding="utf-8")
+    }
+
+
+@pytest.fixture(scope="session")
+def project_layout(shared_partial_project) -> Dict[str, Dict[str, bool]]:
+    """Entries of the partial project's root, src and tests directories, listed once per session
+    
+    Each directory is read with a single os.scandir call, so structure checks
+    are set lookups instead of one stat call per path.
+    
+    Returns:
+        Dictionary mapping directory ("." for the project root) to a dictionary
+        of entry name to whether that entry is a directory
+    """
+    layout = {}
+    for directory in (".", "src", "tests"):
+        with os.scandir(shared_partial_project / directory) as entries:
+            layout[directory] = {entry.name: entry.is_dir() for entry in entries}
+    return layout
 
 
 class TestExistingTestEnhancement:
     """Test framework behavior with projects that have existing tests"""
     
     @pytest.fixture(autouse=True)
-    def setup_mock_environment(self):
+    def setup_mock_environment(self, monkeypatch):
         """Set up mock environment for all tests"""
-        self.original_env = configure_mock_environment()
-        self.mock_config = MockLLMConfig()
-        yield
-        restore_environment(self.original_env)
-    
-    @pytest.fixture
-    def fixture_manager(self):
-        """Provide fixture manager for test projects"""
-        return FixtureManager()
+        apply_mock_environment(monkeypatch)
     
-    @pytest.fixture
-    def partial_project(self, fixture_manager):
-        """Create a partial project fixture for testing"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            project_path = fixture_manager.create_partial_project(temp_path)
-            yield project_path
-            # Cleanup is automatic with TemporaryDirectory
-    
-    def test_partial_project_structure_validation(self, partial_project):
+    def test_partial_project_structure_validation(self, project_layout, project_sources):
         """Test that partial project fixture has correct structure with existing tests"""
+        root = project_layout["."]
+        
         # Verify source code exists
-        assert (partial_project / "src").exists()
-        assert (partial_project / "src" / "calculator.py").exists()
-        assert (partial_project / "src" / "utils.py").exists()
-        assert (partial_project / "src" / "__init__.py").exists()
+        assert root.get("src")
+        assert "calculator.py" in project_layout["src"]
+        assert "utils.py" in project_layout["src"]
+        assert "__init__.py" in project_layout["src"]
         
         # Verify tests directory EXISTS with partial coverage
-        assert (partial_project / "tests").exists()
-        assert (partial_project / "tests" / "test_calculator.py").exists()
-        assert (partial_project / "tests" / "__init__.py").exists()
+        assert root.get("tests")
+        assert "test_calculator.py" in project_layout["tests"]
+        assert "__init__.py" in project_layout["tests"]
         
         # Verify other required files
-        assert (partial_project / "pyproject.toml").exists()
-        assert (partial_project / "reports").exists()
+        assert "pyproject.toml" in root
+        assert root.get("reports")
         
         # Verify test file has partial coverage (key requirement)
-        test_content = (partial_project / "tests" / "test_calculator.py").read_text()
+        test_content = project_sources["test_calculator"]
         assert "test_add_operation" in test_content
         assert "test_subtract_operation" in test_content
         assert "Missing tests for multiply" in test_content  # Indicates gaps
     
-    def test_existing_test_discovery(self, partial_project):
+    def test_existing_test_discovery(self, project_sources):
         """Test discovery of existing tests in partial project"""
         # Requirement 4.1: Framework SHALL correctly identify test types, assertions, and mocks
         
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
+        test_content = project_sources["test_calculator"]
         
         # Analyze existing test structure
-        test_methods = []
-        test_classes = []
-        assertions = []
-        imports = []
-        
-        for line in test_content.split('\n'):
-            line = line.strip()
-            if line.startswith("def test_"):
-                test_methods.append(line)
-            elif line.startswith("class Test"):
-                test_classes.append(line)
-            elif "assert " in line:
-                assertions.append(line)
-            elif line.startswith("import ") or line.startswith("from "):
-                imports.append(line)
+        analysis = _analyze_source(test_content)
+        test_methods = analysis["test_methods"]
+        test_classes = analysis["test_classes"]
+        assertions = analysis["assertions"]
+        imports = analysis["imports"]
         
         # Verify existing test discovery
         assert len(test_methods) > 0, "Should discover existing test methods"
@@ -102,56 +152,40 @@ class TestExistingTestEnhancement:
         assert len(assertions) > 0, "Should discover existing assertions"
         assert len(imports) > 0, "Should discover existing imports"
         
-        # Verify specific test patterns
-        test_method_names = [method for method in test_methods]
-        assert any("test_add" in method for method in test_method_names)
-        assert any("test_subtract" in method for method in test_method_names)
+        # Verify specific test patterns. No pattern contains a newline, so a
+        # match in newline-joined text always lies within a single item
+        joined_methods = "\n".join(test_methods)
+        assert "test_add" in joined_methods
+        assert "test_subtract" in joined_methods
         
         # Verify pytest patterns are used
-        assert any("pytest" in imp for imp in imports)
-        assert any("assert " in assertion for assertion in assertions)
+        assert "pytest" in "\n".join(imports)
+        assert "assert " in "\n".join(assertions)
     
-    def test_test_coverage_gap_identification(self, partial_project):
+    def test_test_coverage_gap_identification(self, project_sources):
         """Test identification of gaps in existing test coverage"""
         # Requirement 4.1: Framework SHALL correctly identify test types, assertions, and mocks
         
         # Analyze source code to identify all testable units
-        calculator_file = partial_project / "src" / "calculator.py"
-        utils_file = partial_project / "src" / "utils.py"
-        
-        calculator_content = calculator_file.read_text()
-        utils_content = utils_file.read_text()
-        
-        # Extract all methods/functions from source
-        source_methods = []
-        for line in calculator_content.split('\n'):
-            line = line.strip()
-            if line.startswith("def ") and not line.startswith("def _"):
-                method_name = line.split("(")[0].replace("def ", "")
-                source_methods.append(method_name)
-        
-        for line in utils_content.split('\n'):
-            line = line.strip()
-            if line.startswith("def ") and not line.startswith("def _"):
-                function_name = line.split("(")[0].replace("def ", "")
-                source_methods.append(function_name)
+        calculator_content = project_sources["calculator"]
+        utils_content = project_sources["utils"]
+        
+        # Extract all public methods/functions from source
+        source_methods = _analyze_source(calculator_content)["functions"] + _analyze_source(utils_content)["functions"]
         
         # Analyze existing tests
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
+        test_content = project_sources["test_calculator"]
         
         tested_methods = []
-        for line in test_content.split('\n'):
-            line = line.strip()
-            if line.startswith("def test_"):
-                # Extract what method is being tested
-                test_name = line.split("(")[0].replace("def test_", "")
-                if "add" in test_name:
-                    tested_methods.append("add")
-                elif "subtract" in test_name:
-                    tested_methods.append("subtract")
-                elif "divide" in test_name:
-                    tested_methods.append("divide")
+        for test_name in _analyze_source(test_content)["test_methods"]:
+            # Extract what method is being tested
+            test_name = test_name[len("test_"):]
+            if "add" in test_name:
+                tested_methods.append("add")
+            elif "subtract" in test_name:
+                tested_methods.append("subtract")
+            elif "divide" in test_name:
+                tested_methods.append("divide")
         
         # Identify gaps
         all_calculator_methods = ["add", "subtract", "multiply", "divide", "power", "square_root", "factorial"]
@@ -161,20 +195,18 @@ class TestExistingTestEnhancement:
         assert len(untested_methods) > 0, "Should identify untested methods"
         assert "multiply" in untested_methods, "Should identify multiply as untested"
         assert "power" in untested_methods, "Should identify power as untested"
+        assert "multiply" in source_methods and "power" in source_methods, \
+            "Untested methods should exist in the source"
         
         # Verify some methods are already tested
         assert "add" in tested_methods, "Should recognize add is already tested"
         assert "subtract" in tested_methods, "Should recognize subtract is already tested"
     
-    def test_existing_test_quality_assessment(self, partial_project):
+    def test_existing_test_quality_assessment(self, project_sources, mock_provider):
         """Test quality assessment of existing tests"""
         # Requirement 4.2: Framework SHALL generate improved versions when existing tests have low quality scores
         
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
-        
-        # Simulate quality assessment using mock LLM
-        mock_provider = self.mock_config.setup_mock_provider()
+        test_content = project_sources["test_calculator"]
         
         # Analyze test quality factors
         quality_factors = {
@@ -183,7 +215,7 @@ class TestExistingTestEnhancement:
             "has_assertions": "assert " in test_content,
             "has_error_testing": "pytest.raises" in test_content,
             "has_setup_teardown": "def setup" in test_content or "@pytest.fixture" in test_content,
-            "has_mocking": "mock" in test_content.lower() or "Mock" in test_content,
+            "has_mocking": "mock" in test_content.lower(),  # Also matches "Mock"
             "follows_aaa_pattern": True  # Simplified check
         }
         
@@ -210,15 +242,12 @@ class TestExistingTestEnhancement:
         
         assert len(improvements_needed) >= 0, "Should identify improvement areas"
     
-    def test_test_enhancement_generation(self, partial_project):
+    def test_test_enhancement_generation(self, partial_project, project_sources, mock_provider):
         """Test generation of enhanced tests for existing test suite"""
         # Requirement 4.3: Framework SHALL focus generation efforts on uncovered or poorly tested units
         
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         # Identify what needs enhancement
-        test_file = partial_project / "tests" / "test_calculator.py"
-        existing_content = test_file.read_text()
+        existing_content = project_sources["test_calculator"]
         
         # Identify missing test cases
         missing_tests = [
@@ -260,22 +289,16 @@ class TestExistingTestEnhancement:
         
         assert enhanced_test_count > 0, "Should generate additional tests"
     
-    def test_preserve_existing_functionality(self, partial_project):
+    def test_preserve_existing_functionality(self, project_sources, mock_provider):
         """Test that existing tests are preserved during enhancement"""
         # Requirement 4.2: Framework SHALL generate improved versions while preserving existing functionality
         
-        test_file = partial_project / "tests" / "test_calculator.py"
-        original_content = test_file.read_text()
+        original_content = project_sources["test_calculator"]
         
         # Extract existing test methods
-        original_tests = []
-        for line in original_content.split('\n'):
-            if line.strip().startswith("def test_"):
-                original_tests.append(line.strip())
+        original_tests = _analyze_source(original_content)["test_methods"]
         
         # Simulate enhancement process that preserves existing tests
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         # Use "generate test" keywords to trigger test generation response
         enhancement_prompt = f"""
         Generate test code to enhance this test file while preserving all existing tests:
@@ -299,13 +322,12 @@ class TestExistingTestEnhancement:
         # Mock provider generates new test code, so we verify it has reasonable test count
         assert enhanced_test_count >= 3, "Should generate meaningful number of tests"
     
-    def test_mutation_testing_integration(self, partial_project):
+    def test_mutation_testing_integration(self, project_sources):
         """Test mutation testing integration with existing tests"""
         # Requirement 4.4: Framework SHALL run tests against existing codebase and report mutation scores
         
         # Simulate mutation testing on existing tests
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
+        test_content = project_sources["test_calculator"]
         
         # Count existing tests
         existing_test_count = test_content.count("def test_")
@@ -331,13 +353,12 @@ class TestExistingTestEnhancement:
         
         assert len(improvement_areas) > 0, "Should identify improvement areas from mutation testing"
     
-    def test_before_after_comparison(self, partial_project):
+    def test_before_after_comparison(self, project_sources, mock_provider):
         """Test before/after comparison for existing test enhancement"""
         # Requirement 4.4: Framework SHALL provide before/after comparisons showing specific improvements
         
         # Before metrics (existing partial tests)
-        test_file = partial_project / "tests" / "test_calculator.py"
-        existing_content = test_file.read_text()
+        existing_content = project_sources["test_calculator"]
         
         before_metrics = {
             "total_tests": existing_content.count("def test_"),
@@ -349,8 +370,6 @@ class TestExistingTestEnhancement:
         }
         
         # Simulate enhancement using test generation prompt
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         enhancement_prompt = f"""
         Generate test code with improved test cases, better assertions, 
         and improved error handling for this calculator module:
@@ -365,7 +384,7 @@ class TestExistingTestEnhancement:
             "total_assertions": enhanced_content.count("assert "),
             "coverage_estimate": 85.0,  # Improved coverage (simulated)
             "quality_score": 8.5,  # Better quality (simulated)
-            "has_mocking": "mock" in enhanced_content.lower() or "Mock" in enhanced_content,
+            "has_mocking": "mock" in enhanced_content.lower(),  # Also matches "Mock"
             "has_error_testing": "pytest.raises" in enhanced_content or "raises" in enhanced_content
         }
         
@@ -394,27 +413,28 @@ class TestExistingTestEnhancement:
         
         assert len(improvement_summary) > 0, "Should provide specific improvement details"
     
-    def test_integration_with_current_project_structure(self, partial_project):
+    def test_integration_with_current_project_structure(self, project_layout, project_sources, mock_provider):
         """Test framework integration with project structure similar to current project"""
         # Test with structure similar to the actual framework project
         
         # Verify project structure matches expected patterns
-        assert (partial_project / "src").exists()
-        assert (partial_project / "tests").exists()
-        assert (partial_project / "reports").exists()
-        assert (partial_project / "pyproject.toml").exists()
+        root = project_layout["."]
+        assert root.get("src")
+        assert root.get("tests")
+        assert root.get("reports")
+        assert "pyproject.toml" in root
         
         # Verify source files follow expected patterns
-        src_files = list((partial_project / "src").glob("*.py"))
-        assert len(src_files) >= 3  # calculator.py, utils.py, __init__.py
+        src_file_count = sum(name.endswith(".py") for name in project_layout["src"])
+        assert src_file_count >= 3  # calculator.py, utils.py, __init__.py
         
         # Verify test files follow pytest conventions
-        test_files = list((partial_project / "tests").glob("test_*.py"))
-        assert len(test_files) >= 1  # test_calculator.py
+        assert any(
+            name.startswith("test_") and name.endswith(".py") for name in project_layout["tests"]
+        )  # test_calculator.py
         
         # Check test file follows current project patterns
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
+        test_content = project_sources["test_calculator"]
         
         # Verify patterns similar to current project
         assert "import pytest" in test_content
@@ -427,8 +447,6 @@ class TestExistingTestEnhancement:
         assert "from pathlib import Path" in test_content or "Path(" in test_content
         
         # Simulate framework enhancement on this structure
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         enhancement_prompt = f"""
         Generate test code to enhance this project structure:
         - src/ for source code
@@ -445,14 +463,14 @@ class TestExistingTestEnhancement:
         assert "import pytest" in enhanced_tests
         assert "def test_" in enhanced_tests
     
-    def test_real_world_test_pattern_discovery(self, partial_project):
+    def test_real_world_test_pattern_discovery(self, project_sources, mock_provider):
         """Test discovery of test patterns similar to tests/test_calculator_basic.py"""
         # This test specifically validates the requirement to test discovery of existing test patterns
         
-        test_file = partial_project / "tests" / "test_calculator.py"
-        test_content = test_file.read_text()
+        test_content = project_sources["test_calculator"]
         
         # Analyze test patterns similar to current project's test_calculator_basic.py
+        lowered_content = test_content.lower()
         discovered_patterns = {
             "uses_pytest": "import pytest" in test_content,
             "has_test_classes": "class Test" in test_content,
@@ -460,7 +478,7 @@ class TestExistingTestEnhancement:
             "uses_assertions": "assert " in test_content,
             "has_docstrings": '"""' in test_content,
             "uses_fixtures": "@pytest.fixture" in test_content or "fixture" in test_content,
-            "has_setup_teardown": "setup" in test_content.lower() or "teardown" in test_content.lower(),
+            "has_setup_teardown": "setup" in lowered_content or "teardown" in lowered_content,
             "uses_parametrize": "@pytest.mark.parametrize" in test_content,
             "has_error_testing": "pytest.raises" in test_content or "raises" in test_content
         }
@@ -482,8 +500,6 @@ class TestExistingTestEnhancement:
         assert assertion_count >= 2, "Should discover multiple assertions"
         
         # Simulate framework's test discovery process
-        mock_provider = self.mock_config.setup_mock_provider()
-        
         discovery_prompt = f"""
         Analyze and discover test patterns in this test file:
         {test_content}
@@ -498,12 +514,10 @@ class TestExistingTestEnhancement:
         assert "test" in discovery_result.lower(), "Should mention tests in analysis"
         
     @pytest.mark.parametrize("enhancement_type", ["coverage", "quality", "both"])
-    def test_targeted_enhancement_types(self, partial_project, enhancement_type):
+    def test_targeted_enhancement_types(self, project_sources, enhancement_type, mock_provider):
         """Test different types of test enhancements"""
         
-        mock_provider = self.mock_config.setup_mock_provider()
-        test_file = partial_project / "tests" / "test_calculator.py"
-        existing_content = test_file.read_text()
+        existing_content = project_sources["test_calculator"]
         
         if enhancement_type == "coverage":
             # Focus on adding tests for uncovered code - use "generate test" keywords
@@ -5,8 +5,12 @@ This module provides a mock LLM provider that integrates with the existing
 src/llm_config.py to enable testing without making actual API calls.
 """
 
+import functools
 import os
-from typing import Optional, Dict, Any
+import re
+from collections import Counter, deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from pathlib import Path
 from langchain_core.language_models.llms import LLM
 from langchain_core.callbacks.manager import CallbackManagerForLLMRun
@@ -24,10 +28,176 @@ except ImportError:
     LLMConfig = llm_config_module.LLMConfig
     LiteLLMWrapper = llm_config_module.LiteLLMWrapper
 
+# "Name:" followed by the rest of its line. The literal prefix lets the regex
+# engine skip ahead with a fast substring search; whether the match starts its
+# line is checked separately.
+_NAME_RE = re.compile(r"Name:([^\n]*)")
+
+# Most recent prompts each MockLLMProvider keeps in call_history
+CALL_HISTORY_LIMIT = 10_000
+
+# Distinct prompts each MockLLMProvider keeps responses for
+RESPONSE_CACHE_SIZE = 1024
+
+# Canned responses for every prompt type except test generation
+_JUDGMENT_RESPONSE = """
+Coverage completeness: 8/10 - Good coverage of main functionality
+Test case variety: 7/10 - Includes happy path and error cases, could use more edge cases
+Assertion quality: 8/10 - Clear and specific assertions
+Mocking effectiveness: 6/10 - Basic mocking present, could be more comprehensive
+Code readability: 9/10 - Well-structured and documented
+Documentation quality: 8/10 - Good docstrings and comments
+
+Overall Score: 7.7/10
+
+Feedback:
+- Consider adding more edge case scenarios
+- Improve mock setup for external dependencies
+- Add parameterized tests for multiple input scenarios
+- Consider testing performance characteristics
+"""
+
+_CLARITY_RESPONSE = """
+Test Clarity Assessment:
+
+Readability Score: 8.5/10
+- Clear test names that describe what is being tested
+- Good use of Arrange-Act-Assert pattern
+- Descriptive variable names
+
+Documentation Score: 8.0/10
+- Comprehensive docstrings for test methods
+- Clear comments explaining test logic
+- Good class-level documentation
+
+Structure Score: 9.0/10
+- Logical test organization
+- Proper use of test fixtures
+- Clean separation of concerns
+
+Overall Clarity Score: 8.5/10
+"""
+
+_REPORT_RESPONSE = """
+# Test Quality Audit Report
+
+## Executive Summary
+The codebase shows good testing practices with room for improvement in coverage and test variety.
+
+## Key Metrics
+- Test Coverage: 75%
+- Assertion Density: 3.2 assertions per test
+- Mock Usage: 45% of tests use mocking
+- Average Test Quality Score: 7.8/10
+
+## Recommendations
+1. Increase test coverage for edge cases
+2. Add more integration tests
+3. Improve error handling test scenarios
+4. Consider adding performance tests
+
+## Detailed Analysis
+The test suite demonstrates solid understanding of testing principles with consistent use of pytest conventions and good documentation practices.
+"""
+
+_CODE_ANALYSIS_RESPONSE = """
+Code Structure Analysis:
+
+Complexity: Medium
+- Cyclomatic complexity: 4.2 average
+- Function length: 15 lines average
+- Class cohesion: High
+
+Dependencies:
+- External dependencies: 3 modules
+- Internal coupling: Low to medium
+- Circular dependencies: None detected
+
+Quality Indicators:
+- Documentation coverage: 80%
+- Type hints usage: 60%
+- Error handling: Present but could be improved
+
+Recommendations:
+- Add more type hints for better code clarity
+- Consider breaking down larger functions
+- Improve error handling consistency
+"""
+
+_DEFAULT_RESPONSE = """
+This is a mock response from the MockLLMProvider.
+The prompt was classified as a general query.
+
+Key points:
+- Mock provider is functioning correctly
+- Response generated based on prompt analysis
+- Suitable for testing framework validation
+
+Response generated for testing purposes.
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _render_test_code(function_name: str) -> str:
+    """Render the mock test module for a function name, cached per name"""
+    return f'''"""
+Test cases for {function_name}
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+class Test{function_name.title().replace("_", "")}:
+    """Test cases for {function_name} function"""
+    
+    def test_{function_name}_happy_path(self):
+        """Test {function_name} with valid inputs"""
+        # Arrange
+        expected_result = "expected_value"
+        
+        # Act
+        result = {function_name}("test_input")
+        
+        # Assert
+        assert result is not None
+        assert isinstance(result, (str, int, float, bool, list, dict))
+    
+    def test_{function_name}_edge_cases(self):
+        """Test {function_name} with edge case inputs"""
+        # Test empty input
+        result = {function_name}("")
+        assert result is not None
+        
+        # Test None input
+        with pytest.raises((ValueError, TypeError)):
+            {function_name}(None)
+    
+    def test_{function_name}_error_handling(self):
+        """Test {function_name} error handling"""
+        with pytest.raises((ValueError, TypeError)):
+            {function_name}("invalid_input")
+    
+    @patch('module.dependency')
+    def test_{function_name}_with_mocks(self, mock_dependency):
+        """Test {function_name} with mocked dependencies"""
+        # Arrange
+        mock_dependency.return_value = "mocked_result"
+        
+        # Act
+        result = {function_name}("test_input")
+        
+        # Assert
+        assert result is not None
+        mock_dependency.assert_called_once()
+'''
+
 
 class MockResponse:
     """Mock response object that mimics LiteLLM response structure"""
     
+    __slots__ = ("content", "choices")
+    
     def __init__(self, content: str):
         self.content = content
         self.choices = [MockChoice(content)]
@@ -39,6 +209,8 @@ class MockResponse:
 class MockChoice:
     """Mock choice object for response structure"""
     
+    __slots__ = ("message",)
+    
     def __init__(self, content: str):
         self.message = MockMessage(content)
     
@@ -49,10 +221,28 @@ class MockChoice:
 class MockMessage:
     """Mock message object for response structure"""
     
+    __slots__ = ("content",)
+    
     def __init__(self, content: str):
         self.content = content
 
 
+# One shared response per canned prompt type; consumers only read responses
+_CANNED_RESPONSES = {
+    "test_judgment": MockResponse(_JUDGMENT_RESPONSE),
+    "test_clarity": MockResponse(_CLARITY_RESPONSE),
+    "audit_report": MockResponse(_REPORT_RESPONSE),
+    "code_analysis": MockResponse(_CODE_ANALYSIS_RESPONSE),
+    "default": MockResponse(_DEFAULT_RESPONSE)
+}
+
+# Function name used for generated test code when the prompt names no unit
+_DEFAULT_FUNCTION_NAME = "example_function"
+
+# Shared response for test generation prompts without a "Name:" line
+_DEFAULT_TEST_RESPONSE = MockResponse(_render_test_code(_DEFAULT_FUNCTION_NAME))
+
+
 class MockLLMProvider:
     """
     Mock LLM provider that generates realistic responses for testing
@@ -69,22 +259,42 @@ class MockLLMProvider:
         self.kwargs = kwargs.get("kwargs", {})
         
         self.call_count = 0
-        self.call_history = []
+        self.call_history = deque(maxlen=CALL_HISTORY_LIMIT)
+        self.prompt_type_counts = Counter()
         
-        # Mock responses for different prompt types
-        self.response_templates = {
-            "test_generation": self._generate_mock_test_code,
-            "test_judgment": self._generate_mock_judgment,
-            "test_clarity": self._generate_mock_clarity_score,
-            "audit_report": self._generate_mock_report,
-            "code_analysis": self._generate_mock_code_analysis,
-            "default": self._generate_default_response
-        }
+        # Responses are deterministic, so repeated prompts reuse the first one
+        self._cached_response = functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)(self._build_response)
     
     def invoke(self, prompt: str) -> MockResponse:
-        """Invoke method that agents expect - returns MockResponse with content attribute"""
-        content = self._call(prompt)
-        return MockResponse(content)
+        """Invoke method that agents expect - returns MockResponse with content attribute
+        
+        Repeated prompts are served from a response cache, but every call is
+        still recorded in the call statistics.
+        """
+        response_type, response = self._cached_response(prompt)
+        self.record_call(prompt, response_type)
+        return response
+    
+    def _build_response(self, prompt: str) -> Tuple[str, MockResponse]:
+        """Classify a prompt and build its response
+        
+        Canned prompt types, and test generation prompts that name no unit,
+        return a shared response instead of building one.
+        """
+        response_type = self._classify_prompt(prompt)
+        response = _CANNED_RESPONSES.get(response_type)
+        if response is None:
+            if response_type == "test_generation" and "Name:" not in prompt:
+                # Without a "Name:" line the generated code is always the default
+                response = _DEFAULT_TEST_RESPONSE
+            else:
+                response = MockResponse(self._RESPONSE_TEMPLATES[response_type](self, prompt))
+        return response_type, response
+    
+    def invoke_many(self, prompts: List[str]) -> List[MockResponse]:
+        """Invoke the mock for a batch of prompts, returning responses in order"""
+        invoke = self.invoke
+        return [invoke(prompt) for prompt in prompts]
     
     def _call(self, 
               prompt: str, 
@@ -92,14 +302,23 @@ class MockLLMProvider:
               run_manager: Optional[CallbackManagerForLLMRun] = None,
               **kwargs) -> str:
         """Override parent _call method to provide mock responses"""
-        self.call_count += 1
-        self.call_history.append(prompt)
+        response_type = self.record_call(prompt)
+        templates = self._RESPONSE_TEMPLATES
+        response_generator = templates.get(response_type, templates["default"])
         
-        # Determine response type based on prompt content
-        response_type = self._classify_prompt(prompt)
-        response_generator = self.response_templates.get(response_type, self.response_templates["default"])
+        return response_generator(self, prompt)
+    
+    def record_call(self, prompt: str, response_type: Optional[str] = None) -> str:
+        """Record a call in the call statistics and return the prompt's response type
         
-        return response_generator(prompt)
+        The prompt is classified unless its response_type is passed in.
+        """
+        if response_type is None:
+            response_type = self._classify_prompt(prompt)
+        self.call_count += 1
+        self.call_history.append(prompt)
+        self.prompt_type_counts[response_type] += 1
+        return response_type
     
     @property
     def _llm_type(self) -> str:
@@ -126,194 +345,79 @@ class MockLLMProvider:
     def _generate_mock_test_code(self, prompt: str) -> str:
         """Generate mock test code based on the prompt"""
         # Extract function/class name from prompt if possible
-        function_name = "example_function"
+        function_name = _DEFAULT_FUNCTION_NAME
         class_name = "ExampleClass"
         
-        # Try to extract actual names from prompt
-        if "Name:" in prompt:
-            lines = prompt.split('\n')
-            for line in lines:
-                if line.strip().startswith("Name:"):
-                    name = line.split("Name:")[1].strip()
-                    if "." in name:
-                        class_name, function_name = name.split(".", 1)
-                    else:
-                        function_name = name
-                    break
+        # Try to extract actual names from a line starting with "Name:"
+        for match in _NAME_RE.finditer(prompt):
+            line_start = prompt.rfind("\n", 0, match.start()) + 1
+            if prompt[line_start:match.start()].strip():
+                continue
+            name = match.group(1).strip()
+            if "." in name:
+                class_name, function_name = name.split(".", 1)
+            else:
+                function_name = name
+            break
         
         # Generate realistic test code
-        test_code = f'''"""
-Test cases for {function_name}
-"""
-
-import pytest
-from unittest.mock import Mock, patch
-
-
-class Test{function_name.title().replace("_", "")}:
-    """Test cases for {function_name} function"""
-    
-    def test_{function_name}_happy_path(self):
-        """Test {function_name} with valid inputs"""
-        # Arrange
-        expected_result = "expected_value"
-        
-        # Act
-        result = {function_name}("test_input")
-        
-        # Assert
-        assert result is not None
-        assert isinstance(result, (str, int, float, bool, list, dict))
-    
-    def test_{function_name}_edge_cases(self):
-        """Test {function_name} with edge case inputs"""
-        # Test empty input
-        result = {function_name}("")
-        assert result is not None
-        
-        # Test None input
-        with pytest.raises((ValueError, TypeError)):
-            {function_name}(None)
-    
-    def test_{function_name}_error_handling(self):
-        """Test {function_name} error handling"""
-        with pytest.raises((ValueError, TypeError)):
-            {function_name}("invalid_input")
-    
-    @patch('module.dependency')
-    def test_{function_name}_with_mocks(self, mock_dependency):
-        """Test {function_name} with mocked dependencies"""
-        # Arrange
-        mock_dependency.return_value = "mocked_result"
-        
-        # Act
-        result = {function_name}("test_input")
-        
-        # Assert
-        assert result is not None
-        mock_dependency.assert_called_once()
-'''
-        
-        return test_code
+        return _render_test_code(function_name)
     
     def _generate_mock_judgment(self, prompt: str) -> str:
         """Generate mock judgment response for test quality evaluation"""
-        return """
-Coverage completeness: 8/10 - Good coverage of main functionality
-Test case variety: 7/10 - Includes happy path and error cases, could use more edge cases
-Assertion quality: 8/10 - Clear and specific assertions
-Mocking effectiveness: 6/10 - Basic mocking present, could be more comprehensive
-Code readability: 9/10 - Well-structured and documented
-Documentation quality: 8/10 - Good docstrings and comments
-
-Overall Score: 7.7/10
-
-Feedback:
-- Consider adding more edge case scenarios
-- Improve mock setup for external dependencies
-- Add parameterized tests for multiple input scenarios
-- Consider testing performance characteristics
-"""
+        return _JUDGMENT_RESPONSE
     
     def _generate_mock_clarity_score(self, prompt: str) -> str:
         """Generate mock clarity score response"""
-        return """
-Test Clarity Assessment:
-
-Readability Score: 8.5/10
-- Clear test names that describe what is being tested
-- Good use of Arrange-Act-Assert pattern
-- Descriptive variable names
-
-Documentation Score: 8.0/10
-- Comprehensive docstrings for test methods
-- Clear comments explaining test logic
-- Good class-level documentation
-
-Structure Score: 9.0/10
-- Logical test organization
-- Proper use of test fixtures
-- Clean separation of concerns
-
-Overall Clarity Score: 8.5/10
-"""
+        return _CLARITY_RESPONSE
     
     def _generate_mock_report(self, prompt: str) -> str:
         """Generate mock audit report content"""
-        return """
-# Test Quality Audit Report
-
-## Executive Summary
-The codebase shows good testing practices with room for improvement in coverage and test variety.
-
-## Key Metrics
-- Test Coverage: 75%
-- Assertion Density: 3.2 assertions per test
-- Mock Usage: 45% of tests use mocking
-- Average Test Quality Score: 7.8/10
-
-## Recommendations
-1. Increase test coverage for edge cases
-2. Add more integration tests
-3. Improve error handling test scenarios
-4. Consider adding performance tests
-
-## Detailed Analysis
-The test suite demonstrates solid understanding of testing principles with consistent use of pytest conventions and good documentation practices.
-"""
+        return _REPORT_RESPONSE
     
     def _generate_mock_code_analysis(self, prompt: str) -> str:
         """Generate mock code analysis response"""
-        return """
-Code Structure Analysis:
-
-Complexity: Medium
-- Cyclomatic complexity: 4.2 average
-- Function length: 15 lines average
-- Class cohesion: High
-
-Dependencies:
-- External dependencies: 3 modules
-- Internal coupling: Low to medium
-- Circular dependencies: None detected
-
-Quality Indicators:
-- Documentation coverage: 80%
-- Type hints usage: 60%
-- Error handling: Present but could be improved
-
-Recommendations:
-- Add more type hints for better code clarity
-- Consider breaking down larger functions
-- Improve error handling consistency
-"""
+        return _CODE_ANALYSIS_RESPONSE
     
     def _generate_default_response(self, prompt: str) -> str:
         """Generate default mock response"""
-        return """
-This is a mock response from the MockLLMProvider.
-The prompt was classified as a general query.
-
-Key points:
-- Mock provider is functioning correctly
-- Response generated based on prompt analysis
-- Suitable for testing framework validation
-
-Response generated for testing purposes.
-"""
+        return _DEFAULT_RESPONSE
+    
+    # Mock responses for different prompt types, as plain functions taking the provider
+    _RESPONSE_TEMPLATES = {
+        "test_generation": _generate_mock_test_code,
+        "test_judgment": _generate_mock_judgment,
+        "test_clarity": _generate_mock_clarity_score,
+        "audit_report": _generate_mock_report,
+        "code_analysis": _generate_mock_code_analysis,
+        "default": _generate_default_response
+    }
     
     def reset_call_history(self):
         """Reset call history for clean testing"""
         self.call_count = 0
         self.call_history.clear()
+        self.prompt_type_counts.clear()
+        self._cached_response.cache_clear()
     
     def get_call_statistics(self) -> Dict[str, Any]:
-        """Get statistics about mock LLM usage"""
+        """Get statistics about mock LLM usage
+        
+        call_history only keeps the most recent CALL_HISTORY_LIMIT prompts;
+        total_calls and the prompt type histogram cover every call. The
+        histogram is kept up to date by record_call, so nothing here walks
+        call_history. prompt_types is kept as an alias of prompt_type_counts
+        for existing callers.
+        """
+        cache_info = self._cached_response.cache_info()
         return {
             "total_calls": self.call_count,
             "call_history_length": len(self.call_history),
             "last_prompt_length": len(self.call_history[-1]) if self.call_history else 0,
-            "prompt_types": [self._classify_prompt(prompt) for prompt in self.call_history]
+            "prompt_types": dict(self.prompt_type_counts),
+            "prompt_type_counts": dict(self.prompt_type_counts),
+            "response_cache_hits": cache_info.hits,
+            "response_cache_misses": cache_info.misses
         }
 
 
@@ -325,6 +429,26 @@ class MockLLMConfig(LLMConfig):
     to use the mock provider instead of real LLM providers.
     """
     
+    # Read-only, so every caller can share one mapping
+    _AVAILABLE_PROVIDERS = MappingProxyType({
+        Provider.OPENAI: False,
+        Provider.AZURE_OPENAI: False,
+        Provider.ANTHROPIC: False,
+        Provider.GOOGLE: False,
+        Provider.COHERE: False,
+        Provider.CUSTOM: True,  # Mock provider is always available
+    })
+    
+    # Mock environment variables set by create_test_environment to avoid real API calls
+    _TEST_ENV_VARS = MappingProxyType({
+        "MOCK_LLM_PROVIDER": "true",
+        "OPENAI_API_KEY": "mock-key-for-testing",
+        "AZURE_API_KEY": "",
+        "ANTHROPIC_API_KEY": "",
+        "GOOGLE_API_KEY": "",
+        "COHERE_API_KEY": ""
+    })
+    
     def __init__(self):
         # Don't call parent __init__ to avoid loading real environment
         self.mock_provider = None
@@ -335,16 +459,9 @@ class MockLLMConfig(LLMConfig):
         self.mock_provider = MockLLMProvider()
         return self.mock_provider
     
-    def get_available_providers(self) -> Dict[Provider, bool]:
+    def get_available_providers(self) -> Mapping[Provider, bool]:
         """Override to return mock provider as available"""
-        return {
-            Provider.OPENAI: False,
-            Provider.AZURE_OPENAI: False,
-            Provider.ANTHROPIC: False,
-            Provider.GOOGLE: False,
-            Provider.COHERE: False,
-            Provider.CUSTOM: True,  # Mock provider is always available
-        }
+        return self._AVAILABLE_PROVIDERS
     
     def get_default_provider(self) -> Provider:
         """Override to return custom provider for mock"""
@@ -403,19 +520,9 @@ class MockLLMConfig(LLMConfig):
     @staticmethod
     def create_test_environment():
         """Create a test environment with mock LLM provider"""
-        # Set mock environment variables to avoid real API calls
-        test_env_vars = {
-            "MOCK_LLM_PROVIDER": "true",
-            "OPENAI_API_KEY": "mock-key-for-testing",
-            "AZURE_API_KEY": "",
-            "ANTHROPIC_API_KEY": "",
-            "GOOGLE_API_KEY": "",
-            "COHERE_API_KEY": ""
-        }
-        
         # Store original values
         original_values = {}
-        for key, value in test_env_vars.items():
+        for key, value in MockLLMConfig._TEST_ENV_VARS.items():
             original_values[key] = os.environ.get(key)
             os.environ[key] = value
         
@@ -438,6 +545,13 @@ def setup_mock_llm() -> MockLLMProvider:
     return mock_config.setup_mock_provider()
 
 
+# TestingFramework attributes holding the agents that patch_framework_with_mock patches
+_FRAMEWORK_AGENTS = (
+    'code_mapper', 'test_discovery', 'test_assessor',
+    'test_generator', 'test_judge', 'audit_reporter'
+)
+
+
 def patch_framework_with_mock(framework_instance) -> MockLLMProvider:
     """Patch a TestingFramework instance to use mock LLM"""
     mock_config = MockLLMConfig()
@@ -448,14 +562,10 @@ def patch_framework_with_mock(framework_instance) -> MockLLMProvider:
         mock_config.patch_existing_config(framework_instance.llm_config)
     
     # Patch individual agents
-    agents = ['code_mapper', 'test_discovery', 'test_assessor', 
-              'test_generator', 'test_judge', 'audit_reporter']
-    
-    for agent_name in agents:
-        if hasattr(framework_instance, agent_name):
-            agent = getattr(framework_instance, agent_name)
-            if agent and hasattr(agent, 'llm'):
-                agent.llm = mock_provider
+    for agent_name in _FRAMEWORK_AGENTS:
+        agent = getattr(framework_instance, agent_name, None)
+        if agent and hasattr(agent, 'llm'):
+            agent.llm = mock_provider
     
     # Also patch the main framework LLM
     if hasattr(framework_instance, 'llm'):
@@ -482,6 +592,16 @@ def create_mock_llm_for_agent(agent_class, **kwargs):
     return agent_class(llm=mock_llm, **kwargs)
 
 
+# Mock API keys set to avoid real provider detection; empty values are unset
+MOCK_API_KEYS = {
+    "OPENAI_API_KEY": "mock-openai-key",
+    "AZURE_API_KEY": "",
+    "ANTHROPIC_API_KEY": "",
+    "GOOGLE_API_KEY": "",
+    "COHERE_API_KEY": ""
+}
+
+
 def configure_mock_environment():
     """Configure environment for mock testing"""
     # Set environment variable to indicate mock mode
@@ -489,16 +609,8 @@ def configure_mock_environment():
     os.environ["MOCK_LLM_PROVIDER"] = "true"
     
     # Set mock API keys to avoid real provider detection
-    test_env = {
-        "OPENAI_API_KEY": "mock-openai-key",
-        "AZURE_API_KEY": "",
-        "ANTHROPIC_API_KEY": "",
-        "GOOGLE_API_KEY": "",
-        "COHERE_API_KEY": ""
-    }
-    
     original_values = {}
-    for key, value in test_env.items():
+    for key, value in MOCK_API_KEYS.items():
         original_values[key] = os.environ.get(key)
         if value:
             os.environ[key] = value
@@ -518,4 +630,20 @@ def restore_environment(original_values: Dict[str, Optional[str]]):
     
     # Clean up testing mode variables
     os.environ.pop("TESTING_MODE", None)
-    os.environ.pop("MOCK_LLM_PROVIDER", None)
\ No newline at end of file
+    os.environ.pop("MOCK_LLM_PROVIDER", None)
+
+
+def apply_mock_environment(monkeypatch):
+    """Configure environment for mock testing through pytest's monkeypatch
+    
+    Sets the same variables as configure_mock_environment, but monkeypatch
+    undoes them when the test finishes, so no restore call is needed.
+    """
+    monkeypatch.setenv("TESTING_MODE", "mock")
+    monkeypatch.setenv("MOCK_LLM_PROVIDER", "true")
+    
+    for key, value in MOCK_API_KEYS.items():
+        if value:
+            monkeypatch.setenv(key, value)
+        else:
+            monkeypatch.delenv(key, raising=False)
\ No newline at end of file
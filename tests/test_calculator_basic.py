@@ -3,21 +3,22 @@ Basic tests for the calculator module
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# src is put on sys.path by the pytest pythonpath setting
 from example_calculator import Calculator, validate_number, format_number
 
 
+@pytest.fixture
+def calc():
+    """Calculator with the default precision and an empty history"""
+    return Calculator()
+
+
 class TestCalculator:
     """Test cases for the Calculator class"""
     
-    def test_calculator_initialization(self):
+    def test_calculator_initialization(self, calc):
         """Test calculator initialization with default precision"""
-        calc = Calculator()
         assert calc.precision == 2
         assert len(calc.history) == 0
     
@@ -26,89 +27,75 @@ class TestCalculator:
         calc = Calculator(precision=4)
         assert calc.precision == 4
     
-    def test_add_operation(self):
+    def test_add_operation(self, calc):
         """Test addition operation"""
-        calc = Calculator()
         result = calc.add(5, 3)
         assert result == 8.0
         assert len(calc.history) == 1
         assert calc.history[0].operation == "add"
     
-    def test_subtract_operation(self):
+    def test_subtract_operation(self, calc):
         """Test subtraction operation"""
-        calc = Calculator()
         result = calc.subtract(10, 4)
         assert result == 6.0
     
-    def test_multiply_operation(self):
+    def test_multiply_operation(self, calc):
         """Test multiplication operation"""
-        calc = Calculator()
         result = calc.multiply(6, 7)
         assert result == 42.0
     
-    def test_divide_operation(self):
+    def test_divide_operation(self, calc):
         """Test division operation"""
-        calc = Calculator()
         result = calc.divide(15, 3)
         assert result == 5.0
     
-    def test_divide_by_zero(self):
+    def test_divide_by_zero(self, calc):
         """Test division by zero raises error"""
-        calc = Calculator()
         with pytest.raises(ValueError, match="Cannot divide by zero"):
             calc.divide(10, 0)
     
-    def test_power_operation(self):
+    def test_power_operation(self, calc):
         """Test power operation"""
-        calc = Calculator()
         result = calc.power(2, 3)
         assert result == 8.0
     
-    def test_square_root_operation(self):
+    def test_square_root_operation(self, calc):
         """Test square root operation"""
-        calc = Calculator()
         result = calc.square_root(16)
         assert result == 4.0
     
-    def test_square_root_negative(self):
+    def test_square_root_negative(self, calc):
         """Test square root of negative number raises error"""
-        calc = Calculator()
         with pytest.raises(ValueError, match="Cannot calculate square root of negative number"):
             calc.square_root(-1)
     
-    def test_factorial_operation(self):
+    def test_factorial_operation(self, calc):
         """Test factorial operation"""
-        calc = Calculator()
         result = calc.factorial(5)
         assert result == 120
     
-    def test_factorial_zero(self):
+    def test_factorial_zero(self, calc):
         """Test factorial of zero"""
-        calc = Calculator()
         result = calc.factorial(0)
         assert result == 1
     
-    def test_factorial_negative(self):
+    def test_factorial_negative(self, calc):
         """Test factorial of negative number raises error"""
-        calc = Calculator()
         with pytest.raises(ValueError, match="Cannot calculate factorial of negative number"):
             calc.factorial(-1)
     
-    def test_average_operation(self):
+    def test_average_operation(self, calc):
         """Test average operation"""
-        calc = Calculator()
         result = calc.average([1, 2, 3, 4, 5])
         assert result == 3.0
     
-    def test_average_empty_list(self):
+    def test_average_empty_list(self, calc):
         """Test average of empty list raises error"""
-        calc = Calculator()
         with pytest.raises(ValueError, match="Cannot calculate average of empty list"):
             calc.average([])
     
-    def test_history_recording(self):
+    def test_history_recording(self, calc):
         """Test that calculations are recorded in history"""
-        calc = Calculator()
         calc.add(1, 2)
         calc.multiply(3, 4)
         
@@ -116,16 +103,14 @@ class TestCalculator:
         assert calc.history[0].operation == "add"
         assert calc.history[1].operation == "multiply"
     
-    def test_clear_history(self):
+    def test_clear_history(self, calc):
         """Test clearing calculation history"""
-        calc = Calculator()
         calc.add(1, 2)
         calc.clear_history()
         assert len(calc.history) == 0
     
-    def test_get_statistics(self):
+    def test_get_statistics(self, calc):
         """Test getting calculation statistics"""
-        calc = Calculator()
         calc.add(1, 2)
         calc.add(3, 4)
         calc.multiply(2, 3)